@@ -153,6 +153,19 @@ class UserProfile(models.Model):
         auto_now=True, help_text="Timestamp when the profile was last updated."
     )
 
+    @staticmethod
+    def cache_key(user_id: int) -> str:
+        """
+        Return the cache key holding the serialized profile of a user.
+
+        Args:
+            user_id (int): The ID of the profile's user.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"profile:{user_id}"
+
     def __str__(self) -> str:
         """
         Return a string representation of the UserProfile instance.
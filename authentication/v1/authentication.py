@@ -0,0 +1,113 @@
+"""
+Authentication backends for the Authentication app.
+
+This module provides a JWT authentication class that caches the authenticated
+user so repeated requests carrying tokens for the same user do not SELECT the
+CustomUser row every time.
+
+Classes:
+    - CachedJWTAuthentication: simplejwt's JWTAuthentication with a cached user lookup.
+
+Only the columns needed to authenticate and authorize a request are cached,
+never the password hash. Cache entries are dropped by the CustomUser
+post_save/post_delete receivers in `authentication.v1.signals` once the change
+commits, so password changes, deactivation and deletion take effect on the
+next request.
+"""
+
+from typing import Any
+
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+# Seconds an authenticated user stays cached between invalidations.
+AUTH_USER_CACHE_TTL = 300
+
+# User columns kept in the cache; any other field is loaded on first access.
+AUTH_USER_CACHE_FIELDS = frozenset({
+    "id",
+    "username",
+    "email",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "is_guest",
+})
+
+
+def auth_user_cache_key(user_id: Any) -> str:
+    """
+    Build the cache key holding the authenticated user for `user_id`.
+
+    Args:
+        user_id (Any): The value of the token's user id claim.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"auth:user:{user_id}"
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that serves the token's user from the Django cache.
+
+    A cache miss falls back to simplejwt's lookup, which also applies the
+    inactive-user and revoked-token checks, and caches the user's
+    AUTH_USER_CACHE_FIELDS. A hit rebuilds the user from those columns with
+    the remaining fields deferred. When
+    `CHECK_REVOKE_TOKEN` is enabled every request compares the token against
+    the stored password hash, so the cache is bypassed entirely.
+    """
+
+    def get_user(self, validated_token: Token) -> Any:
+        """
+        Return the user identified by the validated token.
+
+        Args:
+            validated_token (Token): The validated access token.
+
+        Returns:
+            Any: The authenticated user instance.
+
+        Raises:
+            InvalidToken: If the token carries no user id claim.
+            AuthenticationFailed: If the user is missing or inactive.
+        """
+        if getattr(api_settings, "CHECK_REVOKE_TOKEN", False):
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = auth_user_cache_key(user_id)
+        cached = cache.get(key)
+        if cached is None:
+            user = super().get_user(validated_token)
+            cache.set(
+                key,
+                {name: getattr(user, name) for name in AUTH_USER_CACHE_FIELDS},
+                AUTH_USER_CACHE_TTL,
+            )
+            return user
+
+        if not cached["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        # from_db expects the values in concrete field order.
+        names = [
+            field.attname
+            for field in self.user_model._meta.concrete_fields
+            if field.attname in cached
+        ]
+        return self.user_model.from_db(
+            router.db_for_read(self.user_model),
+            names,
+            [cached[name] for name in names],
+        )
@@ -0,0 +1,56 @@
+"""
+Centralized exception handling for the REST API.
+
+This module provides the project's DRF `EXCEPTION_HANDLER`. Views only catch
+the exceptions they turn into endpoint-specific responses; everything else
+reaches this handler, which maps the expected ones to the JSON error format
+the views use.
+
+Mapping:
+    - DRF API exceptions and `Http404`: DRF's default handling.
+    - `UserProfile.DoesNotExist`: 404 "Profile not found."
+    - Django `ValidationError`: 400 with the validation messages.
+    - Anything else: not handled. DRF re-raises it, so Django's 500 handling,
+      error logging and Sentry see the original exception, and no internal
+      message reaches the client.
+"""
+
+from typing import Any, Optional
+
+from django.core.exceptions import ValidationError
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+from authentication.models import UserProfile
+
+
+def handler(exc: Exception, context: dict[str, Any]) -> Optional[Response]:
+    """
+    Convert an exception raised by a view into an error response.
+
+    Args:
+        exc (Exception): The exception raised while handling the request.
+        context (dict[str, Any]): DRF's handler context, including the view.
+
+    Returns:
+        Optional[Response]: The error response to send, or None to let the
+        exception propagate.
+    """
+    response = exception_handler(exc, context)
+    if response is not None:
+        return response
+
+    if isinstance(exc, UserProfile.DoesNotExist):
+        return Response(
+            {"error": "Profile not found."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    if isinstance(exc, ValidationError):
+        return Response(
+            {"error": exc.messages},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return None
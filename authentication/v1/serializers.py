@@ -11,6 +11,7 @@ Author: Your Name
 Date: YYYY-MM-DD
 """
 
+import copy
 from typing import Any, Dict, Optional
 
 from django.contrib.auth import authenticate
@@ -228,6 +229,26 @@ class UserProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    # Unbound field instances per serializer class. The field set depends only
+    # on Meta, so the model is introspected once rather than per instantiation.
+    _fields_cache: Dict[type, Dict[str, serializers.Field]] = {}
+
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        """
+        Return fresh copies of the cached fields for this serializer class.
+
+        Copies are made with `copy.deepcopy`, which DRF fields implement by
+        re-instantiating from their constructor arguments, so every serializer
+        instance still binds its own field objects.
+
+        Returns:
+            Dict[str, serializers.Field]: The serializer fields, keyed by name.
+        """
+        fields = self._fields_cache.get(type(self))
+        if fields is None:
+            fields = self._fields_cache[type(self)] = super().get_fields()
+        return {name: copy.deepcopy(field) for name, field in fields.items()}
+
     def to_representation(self, instance: UserProfile) -> Dict[str, Any]:
         """
         Convert the UserProfile instance to a dictionary representation.
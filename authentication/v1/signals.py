@@ -15,12 +15,14 @@ Error Handling:
 
 import logging
 
-from django.db.models.signals import post_save,pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from allauth.account.signals import user_signed_up
 from django.conf import settings
+from django.core.cache import cache
 
 from authentication.models import CustomUser, UserProfile, ProfileVerification
+from authentication.v1.authentication import auth_user_cache_key
 from django.db.models import Model
 from typing import Type
 from django.utils import timezone
@@ -31,7 +33,11 @@ from django.db import transaction
 logger = logging.getLogger(__name__)
 
 
-@receiver(post_save, sender=CustomUser)
+@receiver(
+    post_save,
+    sender=CustomUser,
+    dispatch_uid="authentication.create_or_update_user_profile",
+)
 def create_or_update_user_profile(sender, instance: CustomUser, created: bool, **kwargs) -> None:
     """
     Signal to create or update a UserProfile whenever a CustomUser instance is saved.
@@ -67,7 +73,7 @@ def create_or_update_user_profile(sender, instance: CustomUser, created: bool, *
         logger.error(f"Error creating or updating UserProfile for user {instance.username}: {e}")
 
 
-@receiver(user_signed_up)
+@receiver(user_signed_up, dispatch_uid="authentication.social_user_onboarding")
 def social_user_onboarding(sender, request, user: CustomUser, **kwargs) -> None:
     """
     Signal to perform additional onboarding steps for users who register using social accounts.
@@ -97,7 +103,11 @@ def social_user_onboarding(sender, request, user: CustomUser, **kwargs) -> None:
         logger.error(f"Social onboarding failed for user {user.username}: {e}")
 
 
-@receiver(post_save, sender=CustomUser)
+@receiver(
+    post_save,
+    sender=CustomUser,
+    dispatch_uid="authentication.create_profile_verification",
+)
 def create_profile_verification(sender: Type[Model], instance: CustomUser, created: bool, **kwargs) -> None:
     """
     Signal to create a ProfileVerification instance for a new user and set them as inactive.
@@ -128,15 +138,24 @@ def create_profile_verification(sender: Type[Model], instance: CustomUser, creat
             used=False
         )
 
-        # Send verification email after creating the token
-        if settings.CELERY_ALWAYS_EAGER:
-            # If in test mode, execute task synchronously
-            send_verification_email_task(instance.email, verification.token)
-        else:
-            # In production, use Celery
-            send_verification_email_task.delay(instance.email, verification.token)
+        # Send verification email once the user and token rows are committed,
+        # so the request never waits on SMTP and the worker never sees a token
+        # that was rolled back.
+        def send_email_after_commit() -> None:
+            if settings.CELERY_ALWAYS_EAGER:
+                # If in test mode, execute task synchronously
+                send_verification_email_task(instance.email, verification.token)
+            else:
+                # In production, use Celery
+                send_verification_email_task.delay(instance.email, verification.token)
+
+        transaction.on_commit(send_email_after_commit, using=kwargs.get("using"))
         
-@receiver(pre_save, sender=ProfileVerification)
+@receiver(
+    pre_save,
+    sender=ProfileVerification,
+    dispatch_uid="authentication.handle_token_resend",
+)
 def handle_token_resend(sender: Type[ProfileVerification], instance: ProfileVerification, **kwargs) -> None:
     """
     Signal to handle token renewal and email resend when a ProfileVerification instance is updated.
@@ -202,5 +221,44 @@ def handle_token_resend(sender: Type[ProfileVerification], instance: ProfileVeri
     
     except ProfileVerification.DoesNotExist:
         logger.warning(f"ProfileVerification instance not found for pk={instance.pk}. Skipping signal.")
-        
-        
+
+
+@receiver(post_save, sender=CustomUser, dispatch_uid="authentication.invalidate_auth_user_cache_on_save")
+@receiver(post_delete, sender=CustomUser, dispatch_uid="authentication.invalidate_auth_user_cache_on_delete")
+def invalidate_auth_user_cache(sender: Type[Model], instance: CustomUser, **kwargs) -> None:
+    """
+    Drop the cached authenticated user whenever the CustomUser row changes or is deleted.
+
+    This keeps `CachedJWTAuthentication` from serving a stale active flag,
+    permissions or deleted account after the change is saved. The entry is
+    deleted once the transaction commits; deleting it earlier would let a
+    concurrent request re-cache the old row until the TTL expires.
+
+    Args:
+        sender (Type[Model]): The model class that triggered the signal (CustomUser).
+        instance (CustomUser): The user that was saved or deleted.
+        **kwargs: Additional keyword arguments passed by Django's signal mechanism.
+    """
+    key = auth_user_cache_key(instance.pk)
+    transaction.on_commit(lambda: cache.delete(key), using=kwargs.get("using"))
+
+
+@receiver(post_save, sender=CustomUser, dispatch_uid="authentication.invalidate_profile_cache_on_user_save")
+@receiver(post_save, sender=UserProfile, dispatch_uid="authentication.invalidate_profile_cache_on_save")
+@receiver(post_delete, sender=UserProfile, dispatch_uid="authentication.invalidate_profile_cache_on_delete")
+def invalidate_profile_cache(sender: Type[Model], instance: Model, **kwargs) -> None:
+    """
+    Drop the cached profile representation when the profile or its user changes.
+
+    `UserProfileView.get` caches the serialized profile, which nests the
+    user's details, so saving either model must evict it. As with the cached
+    auth user, the entry is deleted once the transaction commits.
+
+    Args:
+        sender (Type[Model]): The model class that triggered the signal.
+        instance (Model): The CustomUser or UserProfile that was saved or deleted.
+        **kwargs: Additional keyword arguments passed by Django's signal mechanism.
+    """
+    user_id = instance.pk if isinstance(instance, CustomUser) else instance.user_id
+    key = UserProfile.cache_key(user_id)
+    transaction.on_commit(lambda: cache.delete(key), using=kwargs.get("using"))
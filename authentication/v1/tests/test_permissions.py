@@ -27,42 +27,51 @@ from authentication.v1.permissions import (
 User = get_user_model()
 
 class BasePermissionTestCase(APITestCase):
-    """Base test case with common setup."""
+    """
+    Base test case with common setup.
 
-    def setUp(self):
+    Fixtures are created once per class in `setUpTestData` and rolled back by
+    the class-level transaction, so no state leaks between test classes and
+    they can safely run in parallel worker processes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
         # Create roles
-        self.admin_role = Role.objects.create(name='admin')
-        self.manager_role = Role.objects.create(name='manager')
-        self.user_role = Role.objects.create(name='user')
+        cls.admin_role, cls.manager_role, cls.user_role = Role.objects.bulk_create([
+            Role(name='admin'),
+            Role(name='manager'),
+            Role(name='user'),
+        ])
 
         # Create users
-        self.admin = User.objects.create_user(
+        cls.admin = User.objects.create_user(
             username='admin',
             email='admin@example.com',
             password='AdminPass123!',
             is_staff=True,
             is_active=True
         )
-        self.admin.roles.add(self.admin_role)
+        cls.admin.roles.add(cls.admin_role)
 
-        self.manager = User.objects.create_user(
+        cls.manager = User.objects.create_user(
             username='manager',
             email='manager@example.com',
             password='ManagerPass123!',
             is_active=True
         )
-        self.manager.roles.add(self.manager_role)
+        cls.manager.roles.add(cls.manager_role)
 
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='user',
             email='user@example.com',
             password='UserPass123!',
             is_active=True
         )
-        self.user.roles.add(self.user_role)
+        cls.user.roles.add(cls.user_role)
 
-        self.inactive_user = User.objects.create_user(
+        cls.inactive_user = User.objects.create_user(
             username='inactive',
             email='inactive@example.com',
             password='InactivePass123!',
@@ -132,10 +141,11 @@ class AdminPermissionTestCase(BasePermissionTestCase):
 class OwnerPermissionTestCase(BasePermissionTestCase):
     """Test suite for owner permissions."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up additional test data."""
-        super().setUp()
-        self.user_profile = UserProfile.objects.get(user=self.user)
+        super().setUpTestData()
+        cls.user_profile = UserProfile.objects.get(user=cls.user)
 
     def test_owner_access(self):
         """Test owner access to own resources."""
@@ -268,14 +278,15 @@ class ReadOnlyPermissionTestCase(BasePermissionTestCase):
 class ObjectLevelPermissionTestCase(BasePermissionTestCase):
     """Test suite for object-level permissions."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up additional test data."""
-        super().setUp()
-        self.team = Team.objects.create(
+        super().setUpTestData()
+        cls.team = Team.objects.create(
             name='Test Team',
-            leader=self.manager
+            leader=cls.manager
         )
-        self.team.members.add(self.user)
+        cls.team.members.add(cls.user)
 
     def test_team_leader_permissions(self):
         """Test team leader permissions on team objects."""
@@ -203,15 +203,18 @@ class LoginSerializerTestCase(TestCase):
 
     def test_invalid_credentials(self):
         """Test invalid login credentials."""
-        invalid_cases = [
-            {'username': 'testuser', 'password': 'WrongPass123!'},
-            {'username': 'wronguser', 'password': 'TestPass123!'},
-            {'username': '', 'password': 'TestPass123!'},
-            {'username': 'testuser', 'password': ''}
-        ]
-        for case in invalid_cases:
-            serializer = LoginSerializer(data=case)
-            self.assertFalse(serializer.is_valid())
+        invalid_cases = (
+            ('testuser', 'WrongPass123!'),
+            ('wronguser', 'TestPass123!'),
+            ('', 'TestPass123!'),
+            ('testuser', ''),
+        )
+        for username, password in invalid_cases:
+            with self.subTest(username=username, password=password):
+                serializer = LoginSerializer(
+                    data={'username': username, 'password': password}
+                )
+                self.assertFalse(serializer.is_valid())
 
     @patch('authentication.v1.serializers.authenticate')
     def test_inactive_user(self, mock_authenticate):
@@ -10,16 +10,32 @@ This module contains the following tests:
     - Test registering a new user (POST /authentication/api/v1/register/).
     - Test upgrading a guest user to a regular user (POST /authentication/api/v1/register/).
 
+3. Bulk Profile Management:
+    - Test updating many profiles at once
+      (PUT /api/authentication/v1/user-profiles/bulk/).
+    - Test retrieving and deleting many profiles
+      (GET/DELETE /api/authentication/v1/user-profiles/bulk/).
+
 Author: Your Name
 Date: YYYY-MM-DD
 """
 
+import json
 from typing import Dict
 
+from django.contrib.auth.hashers import make_password
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
 from authentication.models import CustomUser, UserProfile
+from authentication.v1.serializers import UserProfileSerializer
+from authentication.v1.views.userprofile_views import (
+    BULK_PROFILE_FIELDS,
+    serialize_profile_row,
+)
 
 
 class UserProfileViewTestCase(APITestCase):
@@ -29,21 +45,37 @@ class UserProfileViewTestCase(APITestCase):
     Includes tests for retrieving and updating user profiles.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
         Set up test data for user profile management tests.
+
+        The user and profile are created once per class; each test runs inside
+        a transaction that is rolled back, so changes do not leak between tests.
         """
-        self.user = CustomUser.objects.create_user(
+        cls.user = CustomUser.objects.create_user(
             username="testuser",
             email="test@example.com",
             password="password123",
         )
-        self.profile = UserProfile.objects.create(
-            user=self.user,
-            preferences={"category": "electronics"},
-        )
-        self.client = APIClient()
+        # The user's post_save receiver has already created the profile.
+        cls.profile = cls.user.profile
+        cls.profile.preferences = {"category": "electronics"}
+        cls.profile.save(update_fields=["preferences"])
+
+    def setUp(self) -> None:
+        """
+        Authenticate the API client for each test.
+
+        APITestCase already builds a fresh APIClient per test, so it is reused
+        here rather than constructing a second one. A client shared across
+        tests would also share the authenticated user instance and its cached
+        `profile` relation, leaking state between tests. The cache is cleared
+        too, since cached profiles outlive the rolled-back rows.
+        """
+        cache.clear()
         self.client.force_authenticate(user=self.user)
+        self.profile_url = reverse("auth:profile")
 
     def test_get_user_profile_success(self) -> None:
         """
@@ -52,10 +84,35 @@ class UserProfileViewTestCase(APITestCase):
         Expected Behavior:
             - Returns HTTP 200 with profile details.
         """
-        response = self.client.get("/authentication/api/v1/user-profile/")
+        # force_authenticate skips the auth lookup: one SELECT for the profile,
+        # with the nested user joined into the same query.
+        with self.assertNumQueries(1):
+            response = self.client.get(self.profile_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["preferences"], {"category": "electronics"})
 
+    def test_get_user_profile_cached(self) -> None:
+        """
+        Test repeat profile reads are served from the cache until the profile changes.
+
+        Expected Behavior:
+            - The second GET runs no queries.
+            - The cached profile is kept until the update commits.
+            - A GET after the commit returns the new data.
+        """
+        self.client.get(self.profile_url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.profile_url)
+        self.assertEqual(response.data["preferences"], {"category": "electronics"})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.preferences = {"category": "fashion"}
+            self.profile.save()
+            self.assertIsNotNone(cache.get(UserProfile.cache_key(self.user.pk)))
+        self.assertIsNone(cache.get(UserProfile.cache_key(self.user.pk)))
+        response = self.client.get(self.profile_url)
+        self.assertEqual(response.data["preferences"], {"category": "fashion"})
+
     def test_get_user_profile_not_found(self) -> None:
         """
         Test retrieving the profile of a user without an associated profile.
@@ -64,7 +121,7 @@ class UserProfileViewTestCase(APITestCase):
             - Returns HTTP 404 with an error message.
         """
         self.profile.delete()
-        response = self.client.get("/authentication/api/v1/user-profile/")
+        response = self.client.get(self.profile_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data["error"], "Profile not found.")
 
@@ -76,7 +133,7 @@ class UserProfileViewTestCase(APITestCase):
             - Returns HTTP 200 with updated profile details.
         """
         data: Dict[str, Dict[str, str]] = {"preferences": {"category": "fashion"}}
-        response = self.client.put("/authentication/api/v1/user-profile/", data)
+        response = self.client.put(self.profile_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["preferences"], {"category": "fashion"})
 
@@ -88,7 +145,7 @@ class UserProfileViewTestCase(APITestCase):
             - Returns HTTP 400 with validation error details.
         """
         data: Dict[str, str] = {"preferences": "invalid_format"}  # Invalid type
-        response = self.client.put("/authentication/api/v1/user-profile/", data)
+        response = self.client.put(self.profile_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_update_user_profile_with_user_data(self) -> None:
@@ -104,7 +161,10 @@ class UserProfileViewTestCase(APITestCase):
             "last_name": "Doe",
             "preferences": {"category": "books"}
         }
-        response = self.client.put("/authentication/api/v1/user-profile/", data)
+        # Profile SELECT, user UPDATE, profile UPDATE from the user's post_save
+        # receiver, and the profile UPDATE itself.
+        with self.assertNumQueries(4):
+            response = self.client.put(self.profile_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["user"]["first_name"], "John")
         self.assertEqual(response.data["user"]["last_name"], "Doe")
@@ -129,14 +189,14 @@ class UserProfileViewTestCase(APITestCase):
             "last_name": "Doe",
             "preferences": {"category": "books"}
         }
-        self.client.put("/authentication/api/v1/user-profile/", initial_data)
+        self.client.put(self.profile_url, initial_data, format="json")
         
         # Then do partial update
         partial_data = {
             "first_name": "Jane",
             "preferences": {"category": "movies"}
         }
-        response = self.client.put("/authentication/api/v1/user-profile/", partial_data)
+        response = self.client.put(self.profile_url, partial_data, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["user"]["first_name"], "Jane")
         self.assertEqual(response.data["user"]["last_name"], "Doe")  # Should remain unchanged
@@ -156,7 +216,7 @@ class UserProfileViewTestCase(APITestCase):
             "created_at": "2024-03-21T12:00:00Z",
             "first_name": "John"
         }
-        response = self.client.put("/authentication/api/v1/user-profile/", data)
+        response = self.client.put(self.profile_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["id"], original_id)  # ID should not change
         self.assertEqual(response.data["user"]["first_name"], "John")  # This should change
@@ -172,7 +232,7 @@ class UserProfileViewTestCase(APITestCase):
             "location": "invalid_location_format",  # Should be GeoJSON format
             "preferences": {"category": "books"}
         }
-        response = self.client.put("/authentication/api/v1/user-profile/", data)
+        response = self.client.put(self.profile_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_update_user_profile_unauthenticated(self) -> None:
@@ -184,7 +244,7 @@ class UserProfileViewTestCase(APITestCase):
         """
         self.client.force_authenticate(user=None)  # Remove authentication
         data = {"preferences": {"category": "books"}}
-        response = self.client.put("/authentication/api/v1/user-profile/", data)
+        response = self.client.put(self.profile_url, data, format="json")
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
@@ -195,17 +255,26 @@ class UserRegistrationViewTestCase(APITestCase):
     Includes tests for registering new users and upgrading guest users.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
         Set up test data for user registration tests.
         """
-        self.guest_user = CustomUser.objects.create_user(
+        cls.guest_user = CustomUser.objects.create_user(
             username="guestuser",
             email="guest@example.com",
             password="password123",
             is_guest=True,
         )
-        self.client = APIClient()
+        # bulk_create skips post_save, so no profile/verification rows are made;
+        # the registration tests never inspect them.
+        cls.registered_user = CustomUser(
+            username="registereduser",
+            email="registered@example.com",
+            password=make_password("password123"),
+            is_guest=False,
+        )
+        CustomUser.objects.bulk_create([cls.registered_user])
 
     def test_register_new_user_success(self) -> None:
         """
@@ -304,13 +373,243 @@ class UserRegistrationViewTestCase(APITestCase):
         Expected Behavior:
             - Returns HTTP 400 with an error message.
         """
-        registered_user = CustomUser.objects.create_user(
-            username="registereduser",
-            email="registered@example.com",
-            password="password123",
-            is_guest=False,
-        )
-        self.client.force_authenticate(user=registered_user)
+        self.client.force_authenticate(user=self.registered_user)
         response = self.client.post("/authentication/api/v1/register/", {})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data["error"], "You are already registered.")
+
+
+class UserProfileBulkViewTestCase(APITestCase):
+    """
+    Test cases for the UserProfileBulkView API endpoints.
+
+    Covers per-entry validation and error reporting for bulk updates, plus
+    bulk retrieval, deletion and the admin-only permission.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """
+        Set up an admin and two regular users, each with a profile.
+        """
+        cls.admin = CustomUser.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="password123",
+            is_staff=True,
+        )
+        cls.first = CustomUser.objects.create_user(
+            username="first",
+            email="first@example.com",
+            password="password123",
+            phone_number="+1000000001",
+        )
+        cls.second = CustomUser.objects.create_user(
+            username="second",
+            email="second@example.com",
+            password="password123",
+        )
+
+    def setUp(self) -> None:
+        """
+        Authenticate as the admin and clear cached users and profiles.
+        """
+        cache.clear()
+        self.client.force_authenticate(user=self.admin)
+        self.bulk_url = reverse("auth:bulk-profiles")
+
+    def test_bulk_update_success(self) -> None:
+        """
+        Test updating several profiles in one request.
+
+        Expected Behavior:
+            - Returns HTTP 200 with every updated profile.
+            - Profile and user changes are persisted, including updated_at.
+        """
+        profile_updated_at = self.second.profile.updated_at
+        user_updated_at = self.second.updated_at
+        data = {
+            "profiles": [
+                {
+                    "user_id": self.first.id,
+                    "data": {"preferences": {"category": "books"}},
+                },
+                {"user_id": self.second.id, "data": {"phone_number": "+1000000002"}},
+            ]
+        }
+        response = self.client.put(self.bulk_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertNotIn("errors", body)
+        self.assertEqual(len(body["updated_profiles"]), 2)
+
+        self.assertEqual(
+            UserProfile.objects.get(user=self.first).preferences, {"category": "books"}
+        )
+        self.second.refresh_from_db()
+        self.assertEqual(self.second.phone_number, "+1000000002")
+        self.assertGreater(self.second.updated_at, user_updated_at)
+        self.assertGreater(self.second.profile.updated_at, profile_updated_at)
+
+    def test_bulk_update_reports_bad_entries(self) -> None:
+        """
+        Test that malformed, duplicate and invalid entries fail individually.
+
+        Expected Behavior:
+            - Returns HTTP 200; the valid entry is applied.
+            - Each bad entry gets its own error.
+        """
+        data = {
+            "profiles": [
+                "not-an-object",
+                {
+                    "user_id": self.first.id,
+                    "data": {"preferences": {"category": "books"}},
+                },
+                {
+                    "user_id": self.first.id,
+                    "data": {"preferences": {"category": "games"}},
+                },
+                {"user_id": self.second.id, "data": {"preferences": "invalid_format"}},
+                {"user_id": self.second.id + 1000, "data": {}},
+                {"data": {}},
+            ]
+        }
+        response = self.client.put(self.bulk_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(len(body["updated_profiles"]), 1)
+        self.assertEqual(len(body["errors"]), 5)
+        self.assertEqual(
+            UserProfile.objects.get(user=self.first).preferences, {"category": "books"}
+        )
+
+    def test_bulk_update_phone_number_conflicts(self) -> None:
+        """
+        Test that phone numbers already taken are rejected per entry.
+
+        Expected Behavior:
+            - Returns HTTP 200 rather than failing the whole batch.
+            - The entry reusing another user's number is reported; the other
+              entry is applied.
+        """
+        data = {
+            "profiles": [
+                {
+                    "user_id": self.second.id,
+                    "data": {"phone_number": self.first.phone_number},
+                },
+                {
+                    "user_id": self.first.id,
+                    "data": {"preferences": {"category": "books"}},
+                },
+            ]
+        }
+        response = self.client.put(self.bulk_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(len(body["updated_profiles"]), 1)
+        self.assertEqual(body["errors"][0]["user_id"], self.second.id)
+        self.assertIn("phone_number", body["errors"][0]["errors"])
+        self.second.refresh_from_db()
+        self.assertIsNone(self.second.phone_number)
+
+    def test_bulk_update_duplicate_phone_numbers_in_batch(self) -> None:
+        """
+        Test that two entries claiming the same new number do not both apply.
+
+        Expected Behavior:
+            - The first entry is applied and the second is reported.
+        """
+        data = {
+            "profiles": [
+                {"user_id": self.first.id, "data": {"phone_number": "+1000000003"}},
+                {"user_id": self.second.id, "data": {"phone_number": "+1000000003"}},
+            ]
+        }
+        response = self.client.put(self.bulk_url, data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(len(body["updated_profiles"]), 1)
+        self.assertEqual(body["errors"][0]["user_id"], self.second.id)
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.phone_number, "+1000000003")
+
+    def test_bulk_update_empty(self) -> None:
+        """
+        Test a bulk update without any entries.
+
+        Expected Behavior:
+            - Returns HTTP 400.
+        """
+        response = self.client.put(self.bulk_url, {"profiles": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_get_profiles(self) -> None:
+        """
+        Test retrieving several profiles by user ID.
+
+        Expected Behavior:
+            - Returns HTTP 200 with one entry per requested profile.
+        """
+        response = self.client.get(
+            self.bulk_url, {"user_ids": f"{self.first.id},{self.second.id}"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profiles = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            {profile["user"]["id"] for profile in profiles},
+            {self.first.id, self.second.id},
+        )
+
+    def test_bulk_get_matches_serializer(self) -> None:
+        """
+        Test that bulk rows render exactly like UserProfileSerializer.
+
+        Expected Behavior:
+            - `serialize_profile_row` output equals the serializer's data for
+              the same profile, so the bulk and single GETs cannot drift apart.
+        """
+        profile = self.first.profile
+        profile.preferences = {"category": "books"}
+        profile.location = Point(13.4, 52.5)
+        profile.save()
+
+        for user_id in (self.first.id, self.second.id):
+            profile = UserProfile.objects.select_related("user").get(user_id=user_id)
+            row = UserProfile.objects.values(*BULK_PROFILE_FIELDS).get(user_id=user_id)
+            self.assertEqual(
+                serialize_profile_row(row), dict(UserProfileSerializer(profile).data)
+            )
+
+    def test_bulk_delete_profiles(self) -> None:
+        """
+        Test deleting several profiles by user ID.
+
+        Expected Behavior:
+            - Returns HTTP 204 and removes the profiles.
+        """
+        response = self.client.delete(
+            f"{self.bulk_url}?user_ids={self.first.id},{self.second.id}"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(
+            UserProfile.objects.filter(
+                user_id__in=[self.first.id, self.second.id]
+            ).exists()
+        )
+
+    def test_bulk_requires_admin(self) -> None:
+        """
+        Test that regular users cannot use the bulk endpoints.
+
+        Expected Behavior:
+            - Returns HTTP 403.
+        """
+        self.client.force_authenticate(user=self.first)
+        response = self.client.put(
+            self.bulk_url,
+            {"profiles": [{"user_id": self.first.id, "data": {}}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
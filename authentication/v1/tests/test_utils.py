@@ -11,17 +11,38 @@ import time
 from unittest.mock import Mock, patch, MagicMock
 from datetime import timedelta
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from redis.exceptions import RedisError
 
-from authentication.models import CustomUser
-from authentication.v1.utils.redis_client import RedisClient
-from authentication.v1.utils.token_manager import TokenManager
+from authentication.models import CustomUser, ProfileVerification, UserProfile
+from authentication.v1.authentication import CachedJWTAuthentication, auth_user_cache_key
+from authentication.v1.utils.redis_client import (
+    ASYNC_FLUSH_INTERVAL,
+    REDIS_FAILURE_THRESHOLD,
+    REDIS_RETRY_INTERVAL,
+    RedisClient,
+    _BackgroundWriter,
+    _get_shared_client,
+    _local_tokens,
+)
+from authentication.v1.utils.token_manager import (
+    TokenManager,
+    _bad_tokens,
+    _verified_tokens,
+)
 
 User = get_user_model()
 
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'redis-client-tests',
+    }
+}
+
 
 class TokenManagerTestCase(TestCase):
     """Test suite for TokenManager utility."""
@@ -30,6 +51,8 @@ class TokenManagerTestCase(TestCase):
 
     def setUp(self) -> None:
         """Set up test data."""
+        _verified_tokens.clear()
+        _bad_tokens.clear()
         self.token_manager = TokenManager()
         self.test_user = User.objects.create_user(
             username="testuser",
@@ -44,16 +67,41 @@ class TokenManagerTestCase(TestCase):
         Validates:
             - Token is created successfully
             - Token contains correct claims
+            - The guest gets a ProfileVerification record
             - Error handling for invalid input
         """
         token = self.token_manager.create_guest_token("guest@example.com")
         self.assertIsInstance(token, str)
         self.assertTrue(len(token) > 0)
+        self.assertTrue(
+            ProfileVerification.objects.filter(user__email="guest@example.com").exists()
+        )
 
         # Test with invalid email
         with self.assertRaises(ValueError):
             self.token_manager.create_guest_token("")
 
+    def test_create_guest_tokens(self) -> None:
+        """
+        Test bulk guest token creation.
+
+        Validates:
+            - One guest user and profile is created per distinct email
+            - Every email gets a token
+            - Registered users' emails are rejected
+        """
+        emails = ["guest1@example.com", "guest2@example.com", "guest1@example.com"]
+        tokens = self.token_manager.create_guest_tokens(emails)
+        self.assertEqual(set(tokens), {"guest1@example.com", "guest2@example.com"})
+
+        guests = User.objects.filter(email__in=tokens, is_guest=True)
+        self.assertEqual(guests.count(), 2)
+        self.assertFalse(any(guest.has_usable_password() for guest in guests))
+        self.assertEqual(UserProfile.objects.filter(user__in=guests).count(), 2)
+
+        with self.assertRaises(ValueError):
+            self.token_manager.create_guest_tokens([self.test_user.email])
+
     def test_create_access_token(self) -> None:
         """
         Test access token creation.
@@ -71,6 +119,25 @@ class TokenManagerTestCase(TestCase):
         with self.assertRaises(ValueError):
             self.token_manager.create_access_token(None)
 
+        # The user may be passed by keyword, like the undecorated method
+        token = self.token_manager.create_access_token(
+            user=self.test_user, expiration=60
+        )
+        self.assertIsInstance(token, str)
+        with self.assertRaises(ValueError):
+            self.token_manager.create_access_token(user=None)
+
+    def test_access_token_expiration(self) -> None:
+        """
+        Test that a custom expiration is applied to the access token.
+
+        Validates:
+            - The token's exp claim honours the requested lifetime
+        """
+        token = self.token_manager.create_access_token(self.test_user, expiration=60)
+        payload = AccessToken(token).payload
+        self.assertLessEqual(payload['exp'] - time.time(), 60)
+
     def test_create_refresh_token(self) -> None:
         """
         Test refresh token creation.
@@ -113,139 +180,313 @@ class TokenManagerTestCase(TestCase):
         with self.assertRaises(ValueError):
             self.token_manager.verify_token("invalid_token")
 
+    def test_create_admin_tokens_bulk(self) -> None:
+        """
+        Test bulk admin token creation.
+
+        Validates:
+            - One token pair is returned per user, in order
+            - Each access token belongs to its user
+        """
+        other_user = User.objects.create_user(
+            username="otheruser",
+            email="other@example.com",
+            password="testpass123"
+        )
+        tokens = self.token_manager.create_admin_tokens_bulk([self.test_user, other_user])
+        self.assertEqual(len(tokens), 2)
+        for user, pair in zip([self.test_user, other_user], tokens):
+            self.assertEqual(AccessToken(pair["access"])["user_id"], user.id)
+            self.assertEqual(RefreshToken(pair["refresh"])["user_id"], user.id)
 
-class RedisClientTestCase(TestCase):
-    """Test suite for RedisClient utility."""
+    def test_verify_token_cache(self) -> None:
+        """
+        Test that verified payloads are served from the cache.
 
-    databases = {'default', 'authentication_shard'}  # Specify required databases
+        Validates:
+            - A repeated token is not verified twice
+            - Callers get independent copies of the payload
+        """
+        token = self.token_manager.create_access_token(self.test_user)
+        with patch(
+            'authentication.v1.utils.token_manager.AccessToken', wraps=AccessToken
+        ) as access_token:
+            first = self.token_manager.verify_token(token)
+            first['user_id'] = None
+            second = self.token_manager.verify_token(token)
+
+        access_token.assert_called_once_with(token)
+        self.assertEqual(second['user_id'], self.test_user.id)
+
+    def test_verify_token_refresh_not_cached(self) -> None:
+        """
+        Test that refresh tokens are verified in full every time.
+
+        Validates:
+            - Refresh tokens verify successfully
+            - Nothing is kept in the verified-token cache
+        """
+        token = self.token_manager.create_refresh_token(self.test_user)
+        payload = self.token_manager.verify_token(token)
+
+        self.assertEqual(payload['user_id'], self.test_user.id)
+        self.assertNotIn(token, _verified_tokens)
+
+    def test_verify_token_rejects_replayed_bad_token(self) -> None:
+        """
+        Test that a rejected token is refused again without decoding.
+
+        Validates:
+            - The second attempt raises ValueError
+            - No token class is instantiated for the replay
+        """
+        with self.assertRaises(ValueError):
+            self.token_manager.verify_token("invalid_token")
+
+        with patch('authentication.v1.utils.token_manager.jwt.decode') as decode:
+            with self.assertRaises(ValueError):
+                self.token_manager.verify_token("invalid_token")
+        decode.assert_not_called()
+
+    def test_extract_user_id(self) -> None:
+        """
+        Test reading the user id claim without verification.
+
+        Validates:
+            - The claim matches the token's user
+            - Malformed tokens raise ValueError
+        """
+        token = self.token_manager.create_access_token(self.test_user)
+        self.assertEqual(
+            self.token_manager.extract_user_id(token), self.test_user.id
+        )
+
+        with self.assertRaises(ValueError):
+            self.token_manager.extract_user_id("invalid_token")
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RedisClientTestCase(SimpleTestCase):
+    """
+    Test suite for RedisClient utility.
+
+    The cache is forced to LocMemCache so RedisClient takes the Django-cache
+    path without any mocking; Redis failures are covered by injecting a
+    failing client in `test_redis_error`. No database is involved.
+    """
 
     def setUp(self) -> None:
         """Set up test data."""
         self.test_key = "test_key"
         self.test_value = "test_value"
+        _get_shared_client.cache_clear()
+        _local_tokens.clear()
+        cache.clear()
         self.redis_client = RedisClient()
 
-    @patch('authentication.v1.utils.redis_client.redis.StrictRedis')
-    @patch('authentication.v1.utils.redis_client.cache')
-    def test_set_token(self, mock_cache, mock_redis) -> None:
+    def test_set_token(self) -> None:
         """
-        Test setting a token in Redis.
+        Test setting a token.
 
         Validates:
             - Token is set successfully
-            - Expiration time is set correctly
-            - Redis errors are handled properly
+            - Token is stored in the cache
         """
-        # Test with Redis
-        mock_instance = mock_redis.return_value
-        mock_instance.setex.return_value = True
-        result = self.redis_client.set_token(
-            self.test_key,
-            self.test_value,
-            3600
-        )
-        self.assertTrue(result)
-
-        # Test with Django cache
-        self.redis_client.use_django_cache = True
-        mock_cache.set.return_value = True
         result = self.redis_client.set_token(
             self.test_key,
             self.test_value,
             3600
         )
         self.assertTrue(result)
+        self.assertEqual(cache.get(self.test_key), self.test_value)
 
-        # Test Redis error
-        self.redis_client.use_django_cache = False
-        mock_instance.setex.side_effect = RedisError()
-        result = self.redis_client.set_token(
-            self.test_key,
-            self.test_value,
-            3600
-        )
-        self.assertFalse(result)
-
-    @patch('authentication.v1.utils.redis_client.redis.StrictRedis')
-    @patch('authentication.v1.utils.redis_client.cache')
-    def test_get_token(self, mock_cache, mock_redis) -> None:
+    def test_get_token(self) -> None:
         """
-        Test retrieving a token from Redis.
+        Test retrieving a token.
 
         Validates:
             - Existing token is retrieved successfully
             - Non-existent token returns None
-            - Redis errors are handled properly
         """
-        # Test with Redis
-        mock_instance = mock_redis.return_value
-        mock_instance.get.return_value = self.test_value
-        result = self.redis_client.get_token(self.test_key)
-        self.assertEqual(result, self.test_value)
-
-        # Test with Django cache
-        self.redis_client.use_django_cache = True
-        mock_cache.get.return_value = self.test_value
+        cache.set(self.test_key, self.test_value, 3600)
         result = self.redis_client.get_token(self.test_key)
         self.assertEqual(result, self.test_value)
 
         # Test non-existent key
-        mock_instance.get.return_value = None
         result = self.redis_client.get_token("nonexistent_key")
         self.assertIsNone(result)
 
-        # Test Redis error
-        mock_instance.get.side_effect = RedisError()
-        result = self.redis_client.get_token(self.test_key)
-        self.assertIsNone(result)
+    def test_get_token_local_cache(self) -> None:
+        """
+        Test the per-process cache in front of get_token.
+
+        Validates:
+            - Repeated reads are served without hitting the backend
+            - Writes and deletes invalidate the cached value
+        """
+        self.redis_client.client = Mock()
+        self.redis_client.client.get.return_value = self.test_value
+
+        self.assertEqual(self.redis_client.get_token(self.test_key), self.test_value)
+        self.assertEqual(self.redis_client.get_token(self.test_key), self.test_value)
+        self.redis_client.client.get.assert_called_once_with(self.test_key)
+
+        self.redis_client.set_token(self.test_key, "new_value", 3600)
+        self.redis_client.client.get.return_value = "new_value"
+        self.assertEqual(self.redis_client.get_token(self.test_key), "new_value")
 
-    @patch('authentication.v1.utils.redis_client.redis.StrictRedis')
-    @patch('authentication.v1.utils.redis_client.cache')
-    def test_delete_token(self, mock_cache, mock_redis) -> None:
+        self.redis_client.delete_token(self.test_key)
+        self.redis_client.client.get.return_value = None
+        self.assertIsNone(self.redis_client.get_token(self.test_key))
+
+    def test_delete_token(self) -> None:
         """
-        Test deleting a token from Redis.
+        Test deleting a token.
 
         Validates:
             - Token is deleted successfully
-            - Redis errors are handled properly
+            - Deleting a missing token reports failure
         """
-        # Test with Redis
-        mock_instance = mock_redis.return_value
-        mock_instance.delete.return_value = 1
-        result = self.redis_client.delete_token(self.test_key)
-        self.assertTrue(result)
+        self.redis_client.set_token(self.test_key, self.test_value, 3600)
+        self.assertTrue(self.redis_client.delete_token(self.test_key))
+        self.assertIsNone(cache.get(self.test_key))
+        self.assertFalse(self.redis_client.delete_token(self.test_key))
 
-        # Test with Django cache
-        self.redis_client.use_django_cache = True
-        mock_cache.delete.return_value = True
-        result = self.redis_client.delete_token(self.test_key)
-        self.assertTrue(result)
+    def test_batch_operations(self) -> None:
+        """
+        Test reading and deleting several tokens at once.
 
-        # Test Redis error
-        self.redis_client.use_django_cache = False
-        mock_instance.delete.side_effect = RedisError()
-        result = self.redis_client.delete_token(self.test_key)
-        self.assertFalse(result)
+        Validates:
+            - Values are returned in key order, with None for missing keys
+            - Deletes report how many tokens were removed
+        """
+        self.redis_client.set_token("batch_a", "value_a", 3600)
+        self.redis_client.set_token("batch_b", "value_b", 3600)
+
+        self.assertEqual(
+            self.redis_client.mget_tokens(["batch_a", "missing", "batch_b"]),
+            ["value_a", None, "value_b"],
+        )
+        self.assertEqual(
+            self.redis_client.mdelete_tokens(["batch_a", "batch_b", "missing"]),
+            2,
+        )
+        self.assertEqual(self.redis_client.mget_tokens(["batch_a"]), [None])
+
+    def test_set_token_async(self) -> None:
+        """
+        Test queued token writes.
+
+        Validates:
+            - Queued writes reach the cache in the background
+            - Writes with different expirations are all stored
+        """
+        self.redis_client.set_token_async("async_a", "value_a", 3600)
+        self.redis_client.set_token_async("async_b", "value_b", 60)
+
+        deadline = time.monotonic() + 1
+        while cache.get("async_b") is None and time.monotonic() < deadline:
+            time.sleep(ASYNC_FLUSH_INTERVAL)
+        self.assertEqual(
+            self.redis_client.mget_tokens(["async_a", "async_b"]),
+            ["value_a", "value_b"],
+        )
 
-    @patch('authentication.v1.utils.redis_client.redis.StrictRedis')
-    @patch('authentication.v1.utils.redis_client.cache')
-    def test_connection_error(self, mock_cache, mock_redis) -> None:
+    def test_background_write_failures(self) -> None:
         """
-        Test Redis connection error handling.
+        Test that failed background writes are logged group by group.
 
         Validates:
-            - Connection errors are handled gracefully
-            - Operations fail safely when Redis is unavailable
+            - A raising group does not stop the groups after it
+            - A write reported as failed is logged
+        """
+        raising = Mock()
+        raising.mset_tokens.side_effect = RedisError()
+        rejecting = Mock()
+        rejecting.mset_tokens.return_value = False
+        storing = Mock()
+        storing.mset_tokens.return_value = True
+
+        logger_name = 'authentication.v1.utils.redis_client'
+        with self.assertLogs(logger_name, level='ERROR') as logs:
+            _BackgroundWriter._write([
+                (raising, "key_a", "value_a", 60),
+                (rejecting, "key_b", "value_b", 60),
+                (storing, "key_c", "value_c", 60),
+            ])
+        self.assertEqual(len(logs.records), 2)
+        storing.mset_tokens.assert_called_once_with({"key_c": "value_c"}, 60)
+
+    def test_redis_error(self) -> None:
         """
-        mock_redis.side_effect = RedisError()
+        Test Redis error handling.
+
+        Validates:
+            - Operations fail safely when Redis raises
+            - Repeated failures stop Redis calls until the retry interval passes
+            - Redis is used again once the interval has passed
+        """
+        failing_client = Mock()
+        failing_client.setex.side_effect = RedisError()
+        failing_client.get.side_effect = RedisError()
+        failing_client.delete.side_effect = RedisError()
+        self.redis_client.use_django_cache = False
+        self.redis_client.client = failing_client
 
-        # Test all operations with connection error
         self.assertFalse(
             self.redis_client.set_token(self.test_key, self.test_value, 3600)
         )
         self.assertIsNone(self.redis_client.get_token(self.test_key))
         self.assertFalse(self.redis_client.delete_token(self.test_key))
 
+        for _ in range(REDIS_FAILURE_THRESHOLD):
+            self.redis_client.get_token(self.test_key)
+        failing_client.get.reset_mock()
+        self.assertIsNone(self.redis_client.get_token(self.test_key))
+        failing_client.get.assert_not_called()
+        self.assertFalse(self.redis_client.use_django_cache)
+
+        failing_client.get.side_effect = None
+        failing_client.get.return_value = self.test_value.encode()
+        with patch(
+            'authentication.v1.utils.redis_client.time.monotonic',
+            return_value=time.monotonic() + REDIS_RETRY_INTERVAL,
+        ):
+            self.assertEqual(self.redis_client.get_token(self.test_key), self.test_value)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedJWTAuthenticationTestCase(TestCase):
+    """Test suite for the cached JWT user lookup."""
+
+    def setUp(self) -> None:
+        """Set up a user and a validated access token for it."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='cacheduser',
+            email='cached@example.com',
+            password='testpass123'
+        )
+        self.auth = CachedJWTAuthentication()
+        self.token = AccessToken.for_user(self.user)
+
+    def test_get_user_served_from_cache(self) -> None:
+        """Test the second lookup for the same token does not query the database."""
+        self.assertEqual(self.auth.get_user(self.token).pk, self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.auth.get_user(self.token).pk, self.user.pk)
+        self.assertNotIn('password', cache.get(auth_user_cache_key(self.user.pk)))
+
+    def test_save_invalidates_cached_user(self) -> None:
+        """Test saving the user drops the cached entry once the save commits."""
+        self.auth.get_user(self.token)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = 'Changed'
+            self.user.save()
+            self.assertIsNotNone(cache.get(auth_user_cache_key(self.user.pk)))
+        self.assertIsNone(cache.get(auth_user_cache_key(self.user.pk)))
+        self.assertEqual(self.auth.get_user(self.token).first_name, 'Changed')
+
 
 class TokenManagerRedisIntegrationTestCase(TestCase):
     """Test suite for integration between TokenManager and RedisClient."""
@@ -15,8 +15,6 @@ from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from authentication.models import UserProfile
-import json
-import tempfile
 from PIL import Image
 import io
 
@@ -27,6 +25,14 @@ class UserProfileViewTests(APITestCase):
 
     databases = {'default', 'authentication_shard'}  # Specify required databases
 
+    @classmethod
+    def setUpClass(cls):
+        """Encode the test PNG once for the whole class."""
+        super().setUpClass()
+        file = io.BytesIO()
+        Image.new('RGB', (100, 100), 'white').save(file, 'PNG')
+        cls._png_bytes = file.getvalue()
+
     def setUp(self):
         """Set up test environment."""
         self.client = APIClient()
@@ -69,11 +75,7 @@ class UserProfileViewTests(APITestCase):
 
     def create_test_image(self):
         """Create a test image file."""
-        file = io.BytesIO()
-        image = Image.new('RGB', (100, 100), 'white')
-        image.save(file, 'PNG')
-        file.seek(0)
-        return SimpleUploadedFile('test.png', file.getvalue(), content_type='image/png')
+        return SimpleUploadedFile('test.png', self._png_bytes, content_type='image/png')
 
     def test_update_profile_image(self):
         """Test updating profile image."""
@@ -194,8 +196,11 @@ class UserProfileBulkOperationsTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Verify updates
+        profiles = UserProfile.objects.in_bulk(
+            [update['user_id'] for update in updates], field_name='user_id'
+        )
         for update in updates:
-            profile = UserProfile.objects.get(user_id=update['user_id'])
+            profile = profiles[update['user_id']]
             self.assertEqual(profile.bio, update['bio'])
             self.assertEqual(profile.location, update['location'])
 
@@ -48,7 +48,7 @@ urlpatterns = [
     # # User profile routes
     path("v1/user-profile/", UserProfileView.as_view(), name="profile"),
     path("v1/user-profile/image/", UserProfileView.as_view(), name="profile-image"),
-    #path("v1/user-profiles/bulk/", UserProfileBulkView.as_view(), name="bulk-profiles"),
+    path("v1/user-profiles/bulk/", UserProfileBulkView.as_view(), name="bulk-profiles"),
     path("v1/user-registration/", UserRegistrationView.as_view(), name="user-registration"),
     path("v1/user-delete/", UserDeleteView.as_view(), name="user-delete"),
     path("v1/activate/", TokenVerificationView.as_view(), name="profile-verification"),
@@ -5,12 +5,222 @@ This module provides a Redis client for setting and retrieving tokens with enhan
 error handling and configurations sourced from Django settings.
 """
 
-from typing import Any, Optional
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import redis
+from cachetools import TTLCache
 from django.conf import settings
 from django.core.cache import cache
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of pooled Redis connections per process.
+REDIS_MAX_CONNECTIONS = 50
+# Seconds to wait for a free pooled connection before raising.
+REDIS_POOL_TIMEOUT = 20
+# Consecutive Redis errors after which a client stops calling Redis, and the
+# seconds it waits before trying Redis again.
+REDIS_FAILURE_THRESHOLD = 5
+REDIS_RETRY_INTERVAL = 30
+# Size and lifetime (seconds) of the per-process cache in front of get_token.
+LOCAL_CACHE_MAXSIZE = 10_000
+LOCAL_CACHE_TTL = 5
+# Largest batch the background writer pipelines at once, and how long (seconds)
+# it waits for more writes before sending a partial batch.
+ASYNC_BATCH_SIZE = 100
+ASYNC_FLUSH_INTERVAL = 0.01
+
+# Recently read tokens, shared by every RedisClient in this process.
+_local_tokens: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL)
+_local_tokens_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_connection_pool(location: str) -> redis.BlockingConnectionPool:
+    """
+    Return the process-wide connection pool for a Redis server.
+
+    The pool is created on first use and shared by every RedisClient, so
+    connections (and their AUTH handshake) are reused across instances. The
+    password comes from settings.REDIS_PASSWORD and is omitted when unset.
+    Responses are left as bytes; RedisClient decodes values once per hit.
+
+    Args:
+        location (str): Redis URL (redis://, rediss:// or unix://).
+
+    Returns:
+        redis.BlockingConnectionPool: The shared connection pool.
+    """
+    options = {
+        'max_connections': REDIS_MAX_CONNECTIONS,
+        'timeout': REDIS_POOL_TIMEOUT,
+    }
+    password = getattr(settings, 'REDIS_PASSWORD', None)
+    if password:
+        # Only send AUTH when a password is actually configured
+        options['password'] = password
+    return redis.BlockingConnectionPool.from_url(location, **options)
+
+
+@lru_cache(maxsize=4096)
+def _encode_key(key: str) -> bytes:
+    """
+    Return the UTF-8 encoding of a Redis key, memoized for hot keys.
+
+    Args:
+        key (str): The token key.
+
+    Returns:
+        bytes: The encoded key.
+    """
+    return key.encode('utf-8')
+
+
+def _decode(value: Optional[bytes]) -> Optional[str]:
+    """
+    Decode a raw Redis reply.
+
+    Args:
+        value (Optional[bytes]): The reply, or None for a missing key.
+
+    Returns:
+        Optional[str]: The decoded value, or None.
+    """
+    return value.decode('utf-8') if value is not None else None
+
+
+@lru_cache(maxsize=1)
+def _get_shared_client() -> Optional[redis.StrictRedis]:
+    """
+    Resolve the token store once per process.
+
+    The default cache settings are read a single time; every RedisClient then
+    reuses the result.
+
+    Returns:
+        Optional[redis.StrictRedis]: The shared Redis client, or None when tokens
+        should be stored through Django's cache backend.
+    """
+    try:
+        cache_backend = settings.CACHES['default']['BACKEND']
+        if 'LocMemCache' in cache_backend:
+            # Use Django's cache for testing
+            return None
+        cache_location = settings.CACHES['default']['LOCATION']
+    except KeyError:
+        return None
+
+    if '://' not in cache_location:
+        # Bare host name on the default port
+        cache_location = f'redis://{cache_location}:6379'
+    return redis.StrictRedis(connection_pool=_get_connection_pool(cache_location))
+
+
+class _BackgroundWriter:
+    """
+    Drains queued token writes on a daemon thread, pipelining them in batches.
+
+    One writer serves the whole process; each write carries the client it is
+    sent through.
+    """
+
+    def __init__(self) -> None:
+        """Start the writer thread."""
+        self._queue: "queue.Queue[Tuple[RedisClient, str, Any, int]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="redis-token-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, client: "RedisClient", key: str, value: Any, expiry: int) -> None:
+        """
+        Queue a token write.
+
+        Args:
+            client (RedisClient): The client the write is sent through.
+            key (str): The key under which the token will be stored.
+            value (Any): The token value to store.
+            expiry (int): The time-to-live (TTL) for the token in seconds.
+        """
+        self._queue.put((client, key, value, expiry))
+
+    def _next_batch(self) -> List[Tuple["RedisClient", str, Any, int]]:
+        """
+        Block for the next write, then collect more until the batch is full or
+        ASYNC_FLUSH_INTERVAL has passed.
+
+        Returns:
+            List[Tuple[RedisClient, str, Any, int]]: The queued
+            (client, key, value, expiry) writes.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + ASYNC_FLUSH_INTERVAL
+        while len(batch) < ASYNC_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    @staticmethod
+    def _write(batch: List[Tuple["RedisClient", str, Any, int]]) -> None:
+        """
+        Write a batch with one MSET-style call per (client, expiry) group.
+
+        Each group is written and logged on its own, so one failing group
+        does not drop the groups after it.
+
+        Args:
+            batch (List[Tuple[RedisClient, str, Any, int]]): The queued
+            (client, key, value, expiry) writes.
+        """
+        grouped: Dict[Tuple[RedisClient, int], Dict[str, Any]] = defaultdict(dict)
+        for client, key, value, expiry in batch:
+            grouped[client, expiry][key] = value
+        for (client, expiry), mapping in grouped.items():
+            try:
+                stored = client.mset_tokens(mapping, expiry)
+            except Exception:
+                logger.exception(
+                    "Background token write of %d keys failed.", len(mapping)
+                )
+                continue
+            if not stored:
+                logger.error("Background token write of %d keys failed.", len(mapping))
+
+    def _run(self) -> None:
+        """Write batches forever; errors are logged so the thread keeps running."""
+        while True:
+            self._write(self._next_batch())
+
+
+_writer: Optional[_BackgroundWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _BackgroundWriter:
+    """
+    Return the process-wide background writer, starting it on first use.
+
+    Returns:
+        _BackgroundWriter: The shared writer.
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _BackgroundWriter()
+    return _writer
+
 
 class RedisClient:
     """Handles Redis connections and operations with enhanced error handling."""
@@ -23,34 +233,45 @@ class RedisClient:
         """
         self.use_django_cache = True
         self.client = cache
+        self._failures = 0
+        self._retry_at = 0.0
 
-        try:
-            cache_backend = settings.CACHES['default']['BACKEND']
-            if 'LocMemCache' not in cache_backend:
-                # Use Redis for production
-                self.use_django_cache = False
-                cache_location = settings.CACHES['default']['LOCATION']
-                if '://' in cache_location:
-                    # Parse Redis URL format (redis://host:port/db)
-                    host = cache_location.split('://')[1].split(':')[0]
-                    port = int(cache_location.split(':')[2].split('/')[0])
-                else:
-                    # Use direct host value
-                    host = cache_location
-                    port = 6379
-
-                self.client = redis.StrictRedis(
-                    host=host,
-                    port=port,
-                    password='redis_password',
-                    decode_responses=True,
+        # Connections are opened lazily; an unreachable server surfaces as a
+        # RedisError on the first operation and trips the fallback from there.
+        shared_client = _get_shared_client()
+        if shared_client is not None:
+            self.use_django_cache = False
+            self.client = shared_client
+
+    def _record_failure(self) -> None:
+        """
+        Count a failed Redis call and stop calling Redis when they repeat.
+
+        Isolated errors only fail the call that raised them; once
+        REDIS_FAILURE_THRESHOLD errors happen in a row, calls fail fast for
+        REDIS_RETRY_INTERVAL seconds before Redis is tried again. A single
+        failure on that retry reopens the circuit. Tokens are never written to
+        another backend meanwhile, since processes still talking to Redis
+        would not see them.
+        """
+        self._failures += 1
+        if self._failures >= REDIS_FAILURE_THRESHOLD:
+            if self._retry_at <= time.monotonic():
+                logger.warning(
+                    "Redis failed %d times in a row; retrying in %d seconds.",
+                    self._failures, REDIS_RETRY_INTERVAL,
                 )
-                # Test connection
-                self.client.ping()
-        except (redis.ConnectionError, Exception):
-            # Keep using Django's cache as fallback
-            self.use_django_cache = True
-            self.client = cache
+            self._failures = REDIS_FAILURE_THRESHOLD - 1
+            self._retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+
+    def _circuit_open(self) -> bool:
+        """
+        Report whether Redis calls are currently being skipped after failures.
+
+        Returns:
+            bool: True while the retry interval has not yet passed.
+        """
+        return not self.use_django_cache and time.monotonic() < self._retry_at
 
     def set_token(self, key: str, value: Any, expiry: int) -> bool:
         """
@@ -64,24 +285,48 @@ class RedisClient:
         Returns:
             bool: True if the token was set successfully, False otherwise.
         """
+        with _local_tokens_lock:
+            _local_tokens.pop(key, None)
+        if self._circuit_open():
+            return False
         try:
             if self.use_django_cache:
-                return bool(self.client.set(key, value, timeout=expiry))
+                # Django's cache.set() returns None; it raises on failure.
+                self.client.set(key, value, timeout=expiry)
+                stored = True
             else:
-                return bool(self.client.setex(key, expiry, value))
-        except (redis.RedisError, Exception):
-            # Fallback to Django cache on Redis error
-            self.use_django_cache = True
-            self.client = cache
-            try:
-                return bool(self.client.set(key, value, timeout=expiry))
-            except Exception:
-                return False
+                stored = self.client.setex(_encode_key(key), expiry, value)
+        except redis.RedisError:
+            self._record_failure()
+            return False
+        self._failures = 0
+        return bool(stored)
+
+    def set_token_async(self, key: str, value: Any, expiry: int) -> None:
+        """
+        Queue a token write without waiting for Redis to acknowledge it.
+
+        Writes are sent by one background thread, shared by every client in
+        the process, that pipelines up to ASYNC_BATCH_SIZE of them per
+        round-trip. Use this only where losing the write (on error or process
+        exit) is acceptable; failures are logged, not reported to the caller.
+
+        Args:
+            key (str): The key under which the token will be stored.
+            value (Any): The token value to store.
+            expiry (int): The time-to-live (TTL) for the token in seconds.
+        """
+        with _local_tokens_lock:
+            _local_tokens.pop(key, None)
+        _get_writer().put(self, key, value, expiry)
 
     def get_token(self, key: str) -> Optional[str]:
         """
         Retrieve a token from Redis.
 
+        Hits are kept in a small per-process cache for LOCAL_CACHE_TTL seconds,
+        so repeated reads of the same key skip the Redis round-trip.
+
         Args:
             key (str): The key of the token to retrieve.
 
@@ -89,25 +334,26 @@ class RedisClient:
             Optional[str]: The token value if found, or None if the key does not exist
             or if there was an error.
         """
+        with _local_tokens_lock:
+            value = _local_tokens.get(key)
+        if value is not None:
+            return value
+        if self._circuit_open():
+            return None
+
         try:
             if self.use_django_cache:
                 value = self.client.get(key)
             else:
-                value = self.client.get(key)
-            if value is None:
-                return None
-            if isinstance(value, bytes):
-                return value.decode('utf-8')
-            return str(value)
-        except (redis.RedisError, Exception):
-            # Fallback to Django cache on Redis error
-            self.use_django_cache = True
-            self.client = cache
-            try:
-                value = self.client.get(key)
-                return str(value) if value is not None else None
-            except Exception:
-                return None
+                value = _decode(self.client.get(_encode_key(key)))
+        except redis.RedisError:
+            self._record_failure()
+            return None
+        self._failures = 0
+        if value is not None:
+            with _local_tokens_lock:
+                _local_tokens[key] = value
+        return value
 
     def delete_token(self, key: str) -> bool:
         """
@@ -119,16 +365,170 @@ class RedisClient:
         Returns:
             bool: True if the token was deleted successfully, False otherwise.
         """
+        with _local_tokens_lock:
+            _local_tokens.pop(key, None)
+        if self._circuit_open():
+            return False
         try:
             if self.use_django_cache:
-                return bool(self.client.delete(key))
+                deleted = self.client.delete(key)
             else:
-                return bool(self.client.delete(key))
-        except (redis.RedisError, Exception):
-            # Fallback to Django cache on Redis error
-            self.use_django_cache = True
-            self.client = cache
-            try:
-                return bool(self.client.delete(key))
-            except Exception:
-                return False
+                deleted = self.client.delete(_encode_key(key))
+        except redis.RedisError:
+            self._record_failure()
+            return False
+        self._failures = 0
+        return bool(deleted)
+
+    def mget_tokens(self, keys: Iterable[str]) -> List[Optional[str]]:
+        """
+        Retrieve several tokens in a single round-trip.
+
+        Args:
+            keys (Iterable[str]): The keys of the tokens to retrieve.
+
+        Returns:
+            List[Optional[str]]: The token values in the order of `keys`, with None
+            for missing keys. Every entry is None if there was an error.
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+        if self._circuit_open():
+            return [None] * len(keys)
+        try:
+            if self.use_django_cache:
+                found = self.client.get_many(keys)
+                values = [found.get(key) for key in keys]
+            else:
+                with self.client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.get(_encode_key(key))
+                    values = [_decode(value) for value in pipe.execute()]
+        except redis.RedisError:
+            self._record_failure()
+            return [None] * len(keys)
+        self._failures = 0
+        return values
+
+    def mset_tokens(self, mapping: Dict[str, Any], expiry: int) -> bool:
+        """
+        Store several tokens with the same expiration in a single round-trip.
+
+        Args:
+            mapping (Dict[str, Any]): The token values keyed by token key.
+            expiry (int): The time-to-live (TTL) for the tokens in seconds.
+
+        Returns:
+            bool: True if every token was set successfully, False otherwise.
+        """
+        if not mapping:
+            return True
+        with _local_tokens_lock:
+            for key in mapping:
+                _local_tokens.pop(key, None)
+        if self._circuit_open():
+            return False
+        try:
+            if self.use_django_cache:
+                # set_many() returns the keys that failed to insert
+                stored = not self.client.set_many(mapping, timeout=expiry)
+            else:
+                with self.client.pipeline(transaction=False) as pipe:
+                    for key, value in mapping.items():
+                        pipe.setex(_encode_key(key), expiry, value)
+                    stored = all(pipe.execute())
+        except redis.RedisError:
+            self._record_failure()
+            return False
+        self._failures = 0
+        return stored
+
+    def mdelete_tokens(self, keys: Iterable[str]) -> int:
+        """
+        Delete several tokens in a single round-trip.
+
+        Args:
+            keys (Iterable[str]): The keys of the tokens to delete.
+
+        Returns:
+            int: The number of tokens deleted, or 0 if there was an error.
+        """
+        keys = list(keys)
+        if not keys:
+            return 0
+        with _local_tokens_lock:
+            for key in keys:
+                _local_tokens.pop(key, None)
+        if self._circuit_open():
+            return 0
+        try:
+            if self.use_django_cache:
+                # delete_many() reports nothing, so count the keys beforehand
+                deleted = len(self.client.get_many(keys))
+                self.client.delete_many(keys)
+            else:
+                deleted = self.client.delete(*map(_encode_key, keys))
+        except redis.RedisError:
+            self._record_failure()
+            return 0
+        self._failures = 0
+        return deleted
+
+
+_client: Optional[RedisClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> RedisClient:
+    """
+    Return the process-wide RedisClient, creating it on first use.
+
+    Sharing one instance also shares its failure counter, so a Redis outage
+    opens the retry interval once for the whole process.
+
+    Returns:
+        RedisClient: The shared client.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = RedisClient()
+    return _client
+
+
+def set_token(key: str, value: Any, expiry: int) -> bool:
+    """
+    Store a token through the shared client.
+
+    See RedisClient.set_token.
+    """
+    return get_client().set_token(key, value, expiry)
+
+
+def get_token(key: str) -> Optional[str]:
+    """
+    Retrieve a token through the shared client.
+
+    See RedisClient.get_token.
+    """
+    return get_client().get_token(key)
+
+
+def delete_token(key: str) -> bool:
+    """
+    Delete a token through the shared client.
+
+    See RedisClient.delete_token.
+    """
+    return get_client().delete_token(key)
+
+
+def set_token_async(key: str, value: Any, expiry: int) -> None:
+    """
+    Queue a token write through the shared client.
+
+    See RedisClient.set_token_async.
+    """
+    get_client().set_token_async(key, value, expiry)
@@ -4,21 +4,207 @@ Utility module for handling JWT token generation.
 Provides methods to create tokens for guest and admin users, with error handling and logging.
 """
 
+import asyncio
+import base64
+import binascii
+import hashlib
+import inspect
+import json
 import logging
-from typing import Dict, Optional
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 from datetime import timedelta
 
+import jwt
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser
+from django.db import close_old_connections, router, transaction
+from django.db.models import Model
 from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
 from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of verified access token payloads kept in memory, and the
+# longest time (seconds) a verification is trusted before the token is
+# checked again.
+VERIFY_CACHE_MAXSIZE = 4096
+VERIFY_CACHE_TTL = 10
+
+# Verified access token payloads keyed by raw token -> (payload, trusted
+# until), least recently used first.
+_verified_tokens: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+_verified_tokens_lock = threading.RLock()
+
+# Size bound and lifetime (seconds) of the cache of tokens that failed verification.
+BAD_TOKEN_CACHE_MAXSIZE = 8192
+BAD_TOKEN_CACHE_TTL = 300
+
+# Digests of recently rejected tokens -> time they were rejected, oldest first.
+_bad_tokens: "OrderedDict[bytes, float]" = OrderedDict()
+_bad_tokens_lock = threading.Lock()
+
+
+def _token_digest(token: str) -> bytes:
+    """
+    Return a short, fixed-size digest identifying a token.
+
+    Args:
+        token (str): The raw token.
+
+    Returns:
+        bytes: A 128-bit BLAKE2b digest of the token.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _is_known_bad(digest: bytes) -> bool:
+    """
+    Check whether a token was rejected within the last BAD_TOKEN_CACHE_TTL seconds.
+
+    Args:
+        digest (bytes): The token digest.
+
+    Returns:
+        bool: True if the token is known to be invalid.
+    """
+    with _bad_tokens_lock:
+        rejected_at = _bad_tokens.get(digest)
+        if rejected_at is None:
+            return False
+        if time.time() - rejected_at < BAD_TOKEN_CACHE_TTL:
+            return True
+        del _bad_tokens[digest]
+    return False
+
+
+def _remember_bad(digest: bytes) -> None:
+    """
+    Record a token that failed verification, evicting the oldest entries.
+
+    Args:
+        digest (bytes): The token digest.
+    """
+    with _bad_tokens_lock:
+        _bad_tokens[digest] = time.time()
+        _bad_tokens.move_to_end(digest)
+        if len(_bad_tokens) > BAD_TOKEN_CACHE_MAXSIZE:
+            _bad_tokens.popitem(last=False)
+
+
+T = TypeVar("T")
+
+# Dedicated pool for token issuance from async code; deliberately separate from
+# Django's thread-sensitive executor so signing never queues behind ORM work.
+_token_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="jwt")
+
+
+def _run_and_release(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run a token function on a pool thread, then release its DB connection.
+
+    Args:
+        fn (Callable[..., T]): The function to run.
+        *args (Any): Positional arguments for `fn`.
+
+    Returns:
+        T: The function's result.
+    """
+    try:
+        return fn(*args)
+    finally:
+        close_old_connections()
+
+
+async def _in_token_pool(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Await a synchronous token function on the dedicated token pool.
+
+    Args:
+        fn (Callable[..., T]): The function to run.
+        *args (Any): Positional arguments for `fn`.
+
+    Returns:
+        T: The function's result.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_token_pool, _run_and_release, fn, *args)
+
+
+@lru_cache(maxsize=None)
+def _get_model(model_name: str) -> Type[Model]:
+    """
+    Return an authentication model class, resolved through the app registry once.
+
+    Importing authentication.models at module level would be circular, so the
+    class is looked up lazily and then cached.
+
+    Args:
+        model_name (str): The model's class name, e.g. "CustomUser".
+
+    Returns:
+        Type[Model]: The model class.
+    """
+    return apps.get_model("authentication", model_name)
+
+
+def _require_user(label: str = "User") -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Build a decorator that rejects a None user before calling a token creator.
+
+    Args:
+        label (str): How the user is described in the error, e.g. "Guest user".
+
+    Returns:
+        Callable[[Callable[..., T]], Callable[..., T]]: The decorator.
+    """
+    message = f"{label} instance cannot be None."
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(fn)
+        user_param = next(iter(signature.parameters))
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            # Bind like the wrapped function would, so the user may also be
+            # passed by keyword and bad arguments raise the same TypeError.
+            if signature.bind(*args, **kwargs).arguments.get(user_param) is None:
+                logger.error(message)
+                raise ValueError(message)
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=32)
+def _td(seconds: int) -> timedelta:
+    """
+    Return a (shared, immutable) timedelta for a token lifetime in seconds.
+
+    Args:
+        seconds (int): The lifetime in seconds.
+
+    Returns:
+        timedelta: The corresponding timedelta.
+    """
+    return timedelta(seconds=seconds)
+
 
 class TokenManager:
     """A utility class for handling JWT token generation."""
 
     @staticmethod
+    @_require_user()
     def create_access_token(user: AbstractUser, expiration: Optional[int] = None) -> str:
         """
         Create a JWT access token for a user.
@@ -33,22 +219,21 @@ class TokenManager:
         Raises:
             ValueError: If token creation fails or the user instance is invalid.
         """
-        if user is None:
-            logger.error("User instance cannot be None.")
-            raise ValueError("User instance cannot be None.")
-
         try:
-            refresh = RefreshToken.for_user(user)
+            # `access_token` is a property that builds a new AccessToken on each
+            # access, so bind it once and adjust/sign that instance.
+            access = RefreshToken.for_user(user).access_token
             if expiration:
-                refresh.access_token.set_exp(lifetime=timedelta(seconds=expiration))
-            access_token = str(refresh.access_token)
-            logger.info(f"Access token created for user: {user.username}")
+                access.set_exp(lifetime=_td(expiration))
+            access_token = str(access)
+            logger.info("Access token created for user: %s", user.username)
             return access_token
         except TokenError as e:
-            logger.error(f"Failed to create access token for user {user.username}: {str(e)}")
+            logger.error("Failed to create access token for user %s: %s", user.username, e)
             raise ValueError("Unable to generate access token.") from e
 
     @staticmethod
+    @_require_user()
     def create_refresh_token(user: AbstractUser, expiration: Optional[int] = None) -> str:
         """
         Create a JWT refresh token for a user.
@@ -63,22 +248,19 @@ class TokenManager:
         Raises:
             ValueError: If token creation fails or the user instance is invalid.
         """
-        if user is None:
-            logger.error("User instance cannot be None.")
-            raise ValueError("User instance cannot be None.")
-
         try:
             refresh = RefreshToken.for_user(user)
             if expiration:
-                refresh.set_exp(lifetime=timedelta(seconds=expiration))
+                refresh.set_exp(lifetime=_td(expiration))
             refresh_token = str(refresh)
-            logger.info(f"Refresh token created for user: {user.username}")
+            logger.info("Refresh token created for user: %s", user.username)
             return refresh_token
         except TokenError as e:
-            logger.error(f"Failed to create refresh token for user {user.username}: {str(e)}")
+            logger.error("Failed to create refresh token for user %s: %s", user.username, e)
             raise ValueError("Unable to generate refresh token.") from e
 
     @staticmethod
+    @_require_user("Guest user")
     def create_guest_token(guest_user: AbstractUser | str) -> str:
         """
         Create a JWT token for guest users.
@@ -92,13 +274,10 @@ class TokenManager:
         Raises:
             ValueError: If token creation fails or the user instance is invalid.
         """
-        if guest_user is None:
-            logger.error("Guest user instance cannot be None.")
-            raise ValueError("Guest user instance cannot be None.")
-
         if isinstance(guest_user, str):
-            from authentication.models import CustomUser
-            guest_user = CustomUser.objects.create_user(
+            # A single guest goes through create_user so the post_save receivers
+            # add its ProfileVerification row and verification email.
+            guest_user = _get_model("CustomUser").objects.create_user(
                 username=guest_user.split('@')[0],
                 email=guest_user,
                 is_guest=True
@@ -107,13 +286,84 @@ class TokenManager:
         try:
             refresh = RefreshToken.for_user(guest_user)
             access_token = str(refresh.access_token)
-            logger.info(f"Access token created for guest user: {guest_user.username}")
+            logger.info("Access token created for guest user: %s", guest_user.username)
             return access_token
         except TokenError as e:
-            logger.error(f"Failed to create guest token for user {guest_user.username}: {str(e)}")
+            logger.error("Failed to create guest token for user %s: %s", guest_user.username, e)
             raise ValueError("Unable to generate guest token.") from e
 
     @staticmethod
+    def create_guest_tokens(emails: List[str]) -> Dict[str, str]:
+        """
+        Create guest users for several emails at once and issue their tokens.
+
+        Guests that do not exist yet are inserted with one bulk INSERT, and their
+        profiles with another, instead of a create_user call per email. All of
+        it runs in one transaction, so a failure leaves no half-created guests.
+        Because bulk_create sends no post_save signals, these guests get no
+        ProfileVerification record or verification email.
+
+        Args:
+            emails (List[str]): The guest email addresses.
+
+        Returns:
+            Dict[str, str]: A JWT access token for each email.
+
+        Raises:
+            ValueError: If an email is empty, belongs to a registered user, or a
+            guest user or token cannot be created.
+        """
+        CustomUser = _get_model("CustomUser")
+        UserProfile = _get_model("UserProfile")
+
+        emails = list(dict.fromkeys(emails))
+        if not all(emails):
+            logger.error("Guest email cannot be empty.")
+            raise ValueError("Guest email cannot be empty.")
+
+        # Users, profiles and tokens succeed or roll back together.
+        with transaction.atomic(using=router.db_for_write(CustomUser)):
+            existing = set(
+                CustomUser.objects.filter(email__in=emails).values_list("email", flat=True)
+            )
+            new_emails = [email for email in emails if email not in existing]
+            CustomUser.objects.bulk_create(
+                [
+                    CustomUser(
+                        username=email.split('@')[0],
+                        email=email,
+                        is_guest=True,
+                        password=make_password(None),
+                    )
+                    for email in new_emails
+                ],
+                ignore_conflicts=True,
+            )
+
+            guests = CustomUser.objects.filter(is_guest=True).in_bulk(emails, field_name="email")
+            missing = [email for email in emails if email not in guests]
+            if missing:
+                logger.error("Unable to create guest users for: %s", ", ".join(missing))
+                raise ValueError("Unable to create guest users.")
+
+            UserProfile.objects.bulk_create(
+                [UserProfile(user=guests[email]) for email in new_emails],
+                ignore_conflicts=True,
+            )
+
+            tokens = {}
+            for email in emails:
+                guest = guests[email]
+                try:
+                    tokens[email] = str(RefreshToken.for_user(guest).access_token)
+                except TokenError as e:
+                    logger.error("Failed to create guest token for user %s: %s", guest.username, e)
+                    raise ValueError("Unable to generate guest token.") from e
+        logger.info("Access tokens created for %d guest users", len(tokens))
+        return tokens
+
+    @staticmethod
+    @_require_user("Admin user")
     def create_admin_tokens(user: AbstractUser) -> Dict[str, str]:
         """
         Create access and refresh tokens for an admin user.
@@ -127,32 +377,106 @@ class TokenManager:
         Raises:
             ValueError: If token creation fails or the user instance is invalid.
         """
-        if user is None:
-            logger.error("Admin user instance cannot be None.")
-            raise ValueError("Admin user instance cannot be None.")
-
         try:
             refresh = RefreshToken.for_user(user)
+            access = refresh.access_token
 
             tokens = {
-                "access": str(refresh.access_token),
+                "access": str(access),
                 "refresh": str(refresh),
             }
-            logger.info(
-                f"Tokens successfully created for admin user: {user.username}"
-            )
+            logger.info("Tokens successfully created for admin user: %s", user.username)
             return tokens
         except TokenError as e:
             logger.error(
-                f"Failed to create tokens for admin user {user.username}: {str(e)}"
+                "Failed to create tokens for admin user %s: %s", user.username, e
             )
             raise ValueError("Unable to generate tokens for the admin user.") from e
 
+    @staticmethod
+    async def create_access_token_async(
+        user: AbstractUser, expiration: Optional[int] = None
+    ) -> str:
+        """
+        Async variant of `create_access_token`, run on the token thread pool.
+        """
+        return await _in_token_pool(TokenManager.create_access_token, user, expiration)
+
+    @staticmethod
+    async def create_refresh_token_async(
+        user: AbstractUser, expiration: Optional[int] = None
+    ) -> str:
+        """
+        Async variant of `create_refresh_token`, run on the token thread pool.
+        """
+        return await _in_token_pool(TokenManager.create_refresh_token, user, expiration)
+
+    @staticmethod
+    async def create_guest_token_async(guest_user: AbstractUser | str) -> str:
+        """
+        Async variant of `create_guest_token`, run on the token thread pool.
+        """
+        return await _in_token_pool(TokenManager.create_guest_token, guest_user)
+
+    @staticmethod
+    async def create_admin_tokens_async(user: AbstractUser) -> Dict[str, str]:
+        """
+        Async variant of `create_admin_tokens`, run on the token thread pool.
+        """
+        return await _in_token_pool(TokenManager.create_admin_tokens, user)
+
+    @staticmethod
+    def create_admin_tokens_bulk(users: List[AbstractUser]) -> List[Dict[str, str]]:
+        """
+        Create access and refresh tokens for several admin users.
+
+        The token backend is resolved once and every payload is signed through
+        it directly, instead of going through `str()` on each token.
+
+        Args:
+            users (List[AbstractUser]): The users for whom tokens are generated.
+
+        Returns:
+            List[Dict[str, str]]: The 'access' and 'refresh' tokens, in the order
+            of `users`.
+
+        Raises:
+            ValueError: If token creation fails or a user instance is invalid.
+        """
+        if any(user is None for user in users):
+            logger.error("Admin user instance cannot be None.")
+            raise ValueError("Admin user instance cannot be None.")
+
+        encode = token_backend.encode
+        tokens = []
+        for user in users:
+            try:
+                refresh = RefreshToken.for_user(user)
+                tokens.append({
+                    "access": encode(refresh.access_token.payload),
+                    "refresh": encode(refresh.payload),
+                })
+            except TokenError as e:
+                logger.error(
+                    "Failed to create tokens for admin user %s: %s", user.username, e
+                )
+                raise ValueError("Unable to generate tokens for the admin user.") from e
+        logger.info("Tokens successfully created for %d admin users", len(tokens))
+        return tokens
+
     @staticmethod
     def verify_token(token: str) -> Dict:
         """
         Verify a JWT token and return its payload.
 
+        Verified access token payloads are kept in a bounded LRU cache for
+        VERIFY_CACHE_TTL seconds (never past their `exp` claim), so a token
+        seen again shortly after skips signature verification. Refresh tokens
+        are always verified in full, since they live for days and may be
+        rotated out or blacklisted meanwhile.
+        Rejected tokens are remembered (by digest) for BAD_TOKEN_CACHE_TTL
+        seconds, so replaying one is refused without decoding it again.
+
         Args:
             token (str): The JWT token to verify.
 
@@ -162,15 +486,81 @@ class TokenManager:
         Raises:
             ValueError: If token verification fails or the token is invalid.
         """
+        with _verified_tokens_lock:
+            entry = _verified_tokens.get(token)
+            if entry is not None:
+                payload, trusted_until = entry
+                if trusted_until > time.time():
+                    _verified_tokens.move_to_end(token)
+                    return dict(payload)
+                # Stale: drop it and verify the token again
+                del _verified_tokens[token]
+
+        digest = _token_digest(token)
+        if _is_known_bad(digest):
+            raise ValueError("Invalid or expired token.")
+
         try:
-            # Try to decode as access token first
-            access_token = AccessToken(token)
-            return access_token.payload
-        except TokenError:
-            try:
-                # If not an access token, try as refresh token
-                refresh_token = RefreshToken(token)
-                return refresh_token.payload
-            except TokenError as e:
-                logger.error(f"Failed to verify token: {str(e)}")
-                raise ValueError("Invalid or expired token.") from e
+            # Peek at the unverified claims to pick the token class, so each
+            # token is verified once instead of trying access then refresh.
+            claims = jwt.decode(token, options={"verify_signature": False})
+        except jwt.DecodeError as e:
+            logger.error("Failed to verify token: %s", e)
+            _remember_bad(digest)
+            raise ValueError("Invalid or expired token.") from e
+
+        if claims.get(api_settings.TOKEN_TYPE_CLAIM) == RefreshToken.token_type:
+            token_class = RefreshToken
+        else:
+            token_class = AccessToken
+        try:
+            payload = token_class(token).payload
+        except TokenError as e:
+            logger.error("Failed to verify token: %s", e)
+            _remember_bad(digest)
+            raise ValueError("Invalid or expired token.") from e
+
+        if token_class is AccessToken:
+            trusted_until = min(payload['exp'], time.time() + VERIFY_CACHE_TTL)
+            with _verified_tokens_lock:
+                _verified_tokens[token] = (payload, trusted_until)
+                _verified_tokens.move_to_end(token)
+                if len(_verified_tokens) > VERIFY_CACHE_MAXSIZE:
+                    _verified_tokens.popitem(last=False)
+        return dict(payload)
+
+    @staticmethod
+    def extract_user_id(token: str) -> int:
+        """
+        Read the user id claim from a JWT without verifying it.
+
+        Only the payload segment is base64url-decoded and parsed, skipping
+        signature checks. The claim name comes from SIMPLE_JWT's
+        `USER_ID_CLAIM`. The result is NOT authenticated: use it for
+        routing, logging or cache keys, and call `verify_token` wherever
+        the caller must be trusted.
+
+        Args:
+            token (str): The JWT token.
+
+        Returns:
+            int: The value of the user id claim.
+
+        Raises:
+            ValueError: If the token is malformed or carries no user id claim.
+        """
+        try:
+            payload_segment = token.split('.')[1]
+            payload = json.loads(base64.urlsafe_b64decode(
+                payload_segment + '=' * (-len(payload_segment) % 4)
+            ))
+            user_id = payload[api_settings.USER_ID_CLAIM]
+        except (AttributeError, IndexError, binascii.Error, ValueError) as e:
+            raise ValueError("Malformed token.") from e
+        except (KeyError, TypeError) as e:
+            raise ValueError("Token has no user id claim.") from e
+
+        try:
+            return int(user_id)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Token has no user id claim.") from e
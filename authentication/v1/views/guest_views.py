@@ -19,7 +19,7 @@ from rest_framework.views import APIView
 
 from authentication.models import CustomUser
 from authentication.v1.serializers import GuestTokenSerializer
-from authentication.v1.utils.redis_client import RedisClient
+from authentication.v1.utils import redis_client
 from authentication.v1.utils.token_manager import TokenManager
 
 # drf-yasg imports for OpenAPI documentation
@@ -114,7 +114,6 @@ class GuestTokenView(APIView):
             serializer.is_valid(raise_exception=True)
 
             email: str = serializer.validated_data["email"]
-            redis_client: RedisClient = RedisClient()
 
             logger.debug(f"Attempting to create/retrieve guest token for email: {email}")
 
@@ -14,35 +14,132 @@ This module provides the following endpoints:
 Error Handling:
     - Handles missing profiles with 404 responses.
     - Handles validation errors with 400 responses.
-    - Catches unexpected exceptions with 500 responses.
+    - Unexpected exceptions are turned into 500 responses by the central
+      handler in `authentication.v1.exceptions`.
 
 Author: Your Name
 Date: YYYY-MM-DD
 """
 
-from typing import Any
+from itertools import chain
+from typing import Any, Iterable, Iterator
+import json
 import logging
 
-from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.http import Http404
+from django.core.files.storage import default_storage
+from django.http import Http404, JsonResponse, QueryDict, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.core.validators import validate_email
+from django.db import IntegrityError, router, transaction
 
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from authentication.models import CustomUser, UserProfile, ProfileVerification
+from authentication.v1.authentication import auth_user_cache_key
 from authentication.v1.serializers import RegisterSerializer, UserProfileSerializer
 
 # Configure a logger for this module.
 logger = logging.getLogger(__name__)
 
+# String values accepted as true for boolean flags sent as form or query data.
+TRUTHY_VALUES = frozenset({"true", "1", "yes", "t"})
+
+# Seconds a serialized profile stays cached for UserProfileView.get.
+PROFILE_CACHE_TTL = 600
+
+# Request keys that belong to the nested user rather than the profile.
+USER_NAME_FIELDS = ("first_name", "last_name")
+
+# Columns read by the bulk GET and PUT; mirrors the fields UserProfileSerializer renders.
+BULK_PROFILE_FIELDS = (
+    "id",
+    "user_id",
+    "user__username",
+    "user__email",
+    "user__first_name",
+    "user__last_name",
+    "user__phone_number",
+    "preferences",
+    "location",
+    "profile_image",
+    "created_at",
+    "updated_at",
+)
+
+# Columns written by the bulk PUT; everything UserProfileSerializer can change.
+BULK_PROFILE_UPDATE_FIELDS = ("preferences", "location", "profile_image", "updated_at")
+BULK_USER_UPDATE_FIELDS = ("phone_number", "first_name", "last_name", "updated_at")
+
+# Per-entry error for a bulk PUT phone_number already owned by another user.
+PHONE_NUMBER_TAKEN_MESSAGE = "A user with this phone number already exists."
+
+# Rows per UPDATE issued by the bulk PUT, keeping each CASE expression bounded.
+BULK_UPDATE_BATCH_SIZE = 1000
+
+# Rows fetched per database round trip while streaming the bulk GET.
+BULK_STREAM_CHUNK_SIZE = 500
+
+# Shared field instance used to format timestamps exactly as the serializer does.
+_datetime_field = serializers.DateTimeField()
+
+
+def serialize_profile_row(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Shape a `values()` row like `UserProfileSerializer` output.
+
+    Args:
+        row (dict[str, Any]): A row selected with `BULK_PROFILE_FIELDS`.
+
+    Returns:
+        dict[str, Any]: The profile representation returned by the API.
+    """
+    location = row["location"]
+    image = row["profile_image"]
+    return {
+        "id": row["id"],
+        "user": {
+            "id": row["user_id"],
+            "username": row["user__username"],
+            "email": row["user__email"],
+            "first_name": row["user__first_name"],
+            "last_name": row["user__last_name"],
+            "phone_number": row["user__phone_number"],
+        },
+        "phone_number": row["user__phone_number"],
+        "preferences": row["preferences"],
+        "location": [location.x, location.y] if location else None,
+        "profile_image": default_storage.url(image) if image else None,
+        "created_at": _datetime_field.to_representation(row["created_at"]),
+        "updated_at": _datetime_field.to_representation(row["updated_at"]),
+    }
+
+
+def stream_profile_rows(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """
+    Yield a JSON array of profiles one element at a time.
+
+    Args:
+        rows (Iterable[dict[str, Any]]): Rows selected with `BULK_PROFILE_FIELDS`.
+
+    Yields:
+        str: Successive fragments of the JSON array.
+    """
+    yield "["
+    for index, row in enumerate(rows):
+        yield ("," if index else "") + json.dumps(serialize_profile_row(row), cls=JSONEncoder)
+    yield "]"
+
+
 # Define common response schema for error responses.
 error_response_schema = openapi.Schema(
     type=openapi.TYPE_OBJECT,
@@ -60,6 +157,42 @@ error_response_schema = openapi.Schema(
     }
 )
 
+# Error responses shared by the swagger_auto_schema declarations below, built
+# once at import rather than once per decorated handler.
+VALIDATION_ERROR_RESPONSE = openapi.Response(
+    description="Validation errors.",
+    schema=error_response_schema
+)
+INVALID_PARAMETERS_RESPONSE = openapi.Response(
+    description="Invalid request parameters.",
+    schema=error_response_schema
+)
+PROFILE_NOT_FOUND_RESPONSE = openapi.Response(
+    description="Profile not found.",
+    schema=error_response_schema
+)
+PROFILES_NOT_FOUND_RESPONSE = openapi.Response(
+    description="One or more profiles not found.",
+    schema=error_response_schema
+)
+INTERNAL_ERROR_RESPONSE = openapi.Response(
+    description="Internal server error.",
+    schema=error_response_schema
+)
+COMMON_ERROR_RESPONSES = {
+    404: PROFILE_NOT_FOUND_RESPONSE,
+    500: INTERNAL_ERROR_RESPONSE,
+}
+
+# Query parameter shared by the bulk GET and DELETE declarations.
+USER_IDS_PARAMETER = openapi.Parameter(
+    'user_ids',
+    openapi.IN_QUERY,
+    description="Comma-separated list of user IDs",
+    type=openapi.TYPE_STRING,
+    required=True,
+)
+
 
 class UserProfileView(APIView):
     """
@@ -77,6 +210,55 @@ class UserProfileView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    @staticmethod
+    def get_profile(request: Any) -> UserProfile:
+        """
+        Load the authenticated user's profile with its user row joined in.
+
+        The serializer nests the user's name and phone fields, so joining here
+        keeps every handler to a single SELECT for the lookup.
+
+        Args:
+            request (Any): The authenticated HTTP request.
+
+        Returns:
+            UserProfile: The profile belonging to `request.user`.
+
+        Raises:
+            UserProfile.DoesNotExist: If the user has no profile.
+        """
+        return UserProfile.objects.select_related("user").get(user_id=request.user.id)
+
+    @staticmethod
+    def build_update_data(request: Any) -> Any:
+        """
+        Build the serializer input for put/patch, nesting the user's name fields.
+
+        JSON bodies get a shallow dict so handlers can adjust keys without
+        touching `request.data`. Form bodies are only copied when the nested
+        user data has to be injected, since `QueryDict.copy()` deep-copies
+        every value including uploaded files.
+
+        Args:
+            request (Any): The HTTP request containing the profile data.
+
+        Returns:
+            Any: The data to pass to `UserProfileSerializer`.
+        """
+        data = request.data
+        user_data = {field: data[field] for field in USER_NAME_FIELDS if field in data}
+
+        if isinstance(data, QueryDict):
+            if not user_data:
+                return data
+            data = data.copy()
+        else:
+            data = {key: value for key, value in data.items() if key not in user_data}
+
+        if user_data:
+            data['user'] = user_data
+        return data
+
     @swagger_auto_schema(
         operation_description="Retrieve the profile of the authenticated user.",
         responses={
@@ -84,14 +266,7 @@ class UserProfileView(APIView):
                 description="Successfully retrieved profile details.",
                 schema=UserProfileSerializer()
             ),
-            404: openapi.Response(
-                description="Profile not found.",
-                schema=error_response_schema
-            ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            **COMMON_ERROR_RESPONSES,
         },
     )
     def get(self, request: Any) -> Response:
@@ -103,21 +278,15 @@ class UserProfileView(APIView):
             - 404: Profile not found.
             - 500: Internal server error.
         """
-        try:
-            profile = request.user.profile  # Assuming a One-to-One relationship exists.
-            serializer = UserProfileSerializer(profile)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except UserProfile.DoesNotExist:
-            return Response(
-                {"error": "Profile not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
-            logger.error("Error retrieving user profile: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        # The representation only changes when the profile or its user is
+        # saved, and the signals drop this key whenever that happens.
+        cache_key = UserProfile.cache_key(request.user.id)
+        data = cache.get(cache_key)
+        if data is None:
+            profile = self.get_profile(request)
+            data = UserProfileSerializer(profile).data
+            cache.set(cache_key, data, PROFILE_CACHE_TTL)
+        return Response(data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         operation_description="Update the profile of the authenticated user.",
@@ -127,18 +296,8 @@ class UserProfileView(APIView):
                 description="Successfully updated profile details.",
                 schema=UserProfileSerializer()
             ),
-            400: openapi.Response(
-                description="Validation errors.",
-                schema=error_response_schema
-            ),
-            404: openapi.Response(
-                description="Profile not found.",
-                schema=error_response_schema
-            ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            400: VALIDATION_ERROR_RESPONSE,
+            **COMMON_ERROR_RESPONSES,
         },
     )
     def put(self, request: Any) -> Response:
@@ -154,34 +313,14 @@ class UserProfileView(APIView):
             - 404: Profile not found.
             - 500: Internal server error.
         """
-        try:
-            profile = request.user.profile
-            # Handle nested user data by including it in the request data
-            data = request.data.copy()
-            if 'first_name' in request.data or 'last_name' in request.data:
-                user_data = {}
-                if 'first_name' in request.data:
-                    user_data['first_name'] = request.data['first_name']
-                if 'last_name' in request.data:
-                    user_data['last_name'] = request.data['last_name']
-                data['user'] = user_data
-
-            serializer = UserProfileSerializer(profile, data=data)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except UserProfile.DoesNotExist:
-            return Response(
-                {"error": "Profile not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
-            logger.error("Error updating user profile: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        profile = self.get_profile(request)
+        data = self.build_update_data(request)
+
+        serializer = UserProfileSerializer(profile, data=data)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @swagger_auto_schema(
         operation_description="Partially update the profile of the authenticated user.",
@@ -191,18 +330,8 @@ class UserProfileView(APIView):
                 description="Successfully updated profile details.",
                 schema=UserProfileSerializer()
             ),
-            400: openapi.Response(
-                description="Validation errors.",
-                schema=error_response_schema
-            ),
-            404: openapi.Response(
-                description="Profile not found.",
-                schema=error_response_schema
-            ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            400: VALIDATION_ERROR_RESPONSE,
+            **COMMON_ERROR_RESPONSES,
         },
     )
     def patch(self, request: Any) -> Response:
@@ -218,45 +347,25 @@ class UserProfileView(APIView):
             - 404: Profile not found.
             - 500: Internal server error.
         """
-        try:
-            profile = request.user.profile
-            # Handle nested user data by including it in the request data
-            data = request.data.copy()
-            if 'first_name' in request.data or 'last_name' in request.data:
-                user_data = {}
-                if 'first_name' in request.data:
-                    user_data['first_name'] = request.data['first_name']
-                if 'last_name' in request.data:
-                    user_data['last_name'] = request.data['last_name']
-                data['user'] = user_data
-
-            # Handle preferences update
-            if 'preferences' in data:
-                if not isinstance(data['preferences'], dict):
-                    return Response(
-                        {"error": "Preferences must be a JSON object."},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                current_preferences = profile.preferences or {}
-                current_preferences.update(data['preferences'])
-                data['preferences'] = current_preferences
+        profile = self.get_profile(request)
+        data = self.build_update_data(request)
 
-            serializer = UserProfileSerializer(profile, data=data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except UserProfile.DoesNotExist:
-            return Response(
-                {"error": "Profile not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
-            logger.error("Error updating user profile: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        # Handle preferences update
+        if 'preferences' in data:
+            if not isinstance(data['preferences'], dict):
+                return Response(
+                    {"error": "Preferences must be a JSON object."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            current_preferences = profile.preferences or {}
+            current_preferences.update(data['preferences'])
+            data['preferences'] = current_preferences
+
+        serializer = UserProfileSerializer(profile, data=data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @swagger_auto_schema(
         operation_description="Delete the profile image of the authenticated user.",
@@ -264,14 +373,7 @@ class UserProfileView(APIView):
             204: openapi.Response(
                 description="Successfully deleted profile image.",
             ),
-            404: openapi.Response(
-                description="Profile not found.",
-                schema=error_response_schema
-            ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            **COMMON_ERROR_RESPONSES,
         },
     )
     def delete(self, request: Any) -> Response:
@@ -283,23 +385,11 @@ class UserProfileView(APIView):
             - 404: Profile not found.
             - 500: Internal server error.
         """
-        try:
-            profile = request.user.profile
-            if profile.profile_image:
-                profile.profile_image.delete()
-                profile.save()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        except UserProfile.DoesNotExist:
-            return Response(
-                {"error": "Profile not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
-            logger.error("Error deleting profile image: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        profile = self.get_profile(request)
+        if profile.profile_image:
+            profile.profile_image.delete()
+            profile.save()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class UserRegistrationView(APIView):
@@ -356,10 +446,7 @@ class UserRegistrationView(APIView):
                 description="Validation errors or missing fields.",
                 schema=error_response_schema,
             ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema,
-            ),
+            500: INTERNAL_ERROR_RESPONSE,
         },
     )
     def post(self, request: Any) -> Response:
@@ -374,73 +461,64 @@ class UserRegistrationView(APIView):
             - 400: Validation errors or missing fields.
             - 500: Internal server error.
         """
-        try:
-            # Validate required fields
-            email = request.data.get("email")
-            password = request.data.get("password")
-            confirm_password = request.data.get("confirm_password")
-
-            if not all([email, password, confirm_password]):
-                return Response(
-                    {"error": "All fields are required."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Validate email format
-            try:
-                validate_email(email)
-            except ValidationError:
-                return Response(
-                    {"error": "Invalid email format."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Check if passwords match
-            if password != confirm_password:
-                return Response(
-                    {"error": "Passwords do not match."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Check if email is already registered
-            if CustomUser.objects.filter(email=email).exists():
-                return Response(
-                    {"error": "Email is already registered."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+        # Validate required fields
+        email = request.data.get("email")
+        password = request.data.get("password")
+        confirm_password = request.data.get("confirm_password")
 
-            # Create user and profile
-            user = CustomUser.objects.create(
-                email=email,
-                password=make_password(password),
-                is_active=True,
+        if not (email and password and confirm_password):
+            return Response(
+                {"error": "All fields are required."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-            profile = UserProfile.objects.create(user=user)
-
-            # Create verification token
-            verification = ProfileVerification.objects.create(
-                user=user,
-                email=email,
+        # Validate email format
+        try:
+            validate_email(email)
+        except ValidationError:
+            return Response(
+                {"error": "Invalid email format."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            verification.send_verification_email()
 
-            serializer = RegisterSerializer(user)
+        # Check if passwords match
+        if password != confirm_password:
             return Response(
-                {
-                    "message": "User registered successfully.",
-                    "user": serializer.data,
-                },
-                status=status.HTTP_201_CREATED,
+                {"error": "Passwords do not match."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        except Exception as e:
-            logger.error("Error during user registration: %s", str(e), exc_info=True)
+        # Insert directly and let the unique indexes reject duplicates, rather
+        # than checking first and racing a concurrent registration. The email
+        # doubles as the username. The post_save receivers create the profile
+        # and verification rows inside the same transaction.
+        try:
+            with transaction.atomic(using=router.db_for_write(CustomUser)):
+                user = CustomUser.objects.create_user(
+                    username=email,
+                    email=email,
+                    password=password,
+                    is_active=True,
+                )
+        except IntegrityError:
+            # Only a registration of the same email is a client error; any
+            # other constraint failure is a server fault.
+            if not CustomUser.objects.filter(email=email).exists():
+                raise
             return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "Email is already registered."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
+        serializer = RegisterSerializer(user)
+        return Response(
+            {
+                "message": "User registered successfully.",
+                "user": serializer.data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
 
 class UserDeleteView(APIView):
     """
@@ -468,10 +546,7 @@ class UserDeleteView(APIView):
                 description="User is not authorized to delete this account.",
                 schema=error_response_schema
             ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            500: INTERNAL_ERROR_RESPONSE,
         },
     )
     def delete(self, request: Any) -> Response:
@@ -483,17 +558,12 @@ class UserDeleteView(APIView):
             - 403: User is not authorized to perform this action.
             - 500: Internal server error.
         """
-        try:
-            user = request.user  # Get authenticated user
-            CustomUser.objects.filter(id=user.id).delete()
-            # Return 204 No Content without a response body.
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        except Exception as e:
-            logger.error("Error deleting user account: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        # Deleting the loaded instance lets the collector start from it
+        # instead of re-selecting the row through a queryset; cascades and
+        # post_delete receivers still run.
+        request.user.delete()
+        # Return 204 No Content without a response body.
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class TokenVerificationView(APIView):
@@ -534,7 +604,9 @@ class TokenVerificationView(APIView):
                 )
             
             # Fetch the verification instance; get_object_or_404 will raise Http404 if not found.
-            verification = get_object_or_404(ProfileVerification, user__email=email, token=token)
+            verification = get_object_or_404(
+                ProfileVerification.objects.select_related("user"), user__email=email, token=token
+            )
             
             if verification.used:
                 return Response(
@@ -548,9 +620,18 @@ class TokenVerificationView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            verification.mark_as_used()
-            verification.user.activated_profile = True
-            verification.user.save()
+            # Claim the token with a conditional UPDATE so concurrent requests
+            # cannot both pass the checks above and activate the user twice.
+            with transaction.atomic(using=router.db_for_write(ProfileVerification)):
+                claimed = ProfileVerification.objects.filter(
+                    pk=verification.pk, used=False, expires_at__gt=timezone.now()
+                ).update(used=True)
+                if not claimed:
+                    error = "Token has expired." if verification.is_expired() else "Token has already been used."
+                    return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+                verification.user.activated_profile = True
+                verification.user.save(update_fields=["activated_profile"])
             return Response(
                 {"message": "Token verified successfully."},
                 status=status.HTTP_200_OK
@@ -560,12 +641,6 @@ class TokenVerificationView(APIView):
                 {"error": "Invalid email or token."},
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            logger.error("Error verifying token: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
 
     @swagger_auto_schema(
         operation_summary="Resend a new token",
@@ -604,8 +679,11 @@ class TokenVerificationView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Convert force_resend to boolean (handles "true"/"false" strings)
-            force_resend = str(force_resend).lower() in ["true", "1"]
+            # Convert force_resend to boolean (handles JSON booleans and form strings)
+            if isinstance(force_resend, str):
+                force_resend = force_resend.lower() in TRUTHY_VALUES
+            else:
+                force_resend = force_resend is True or force_resend == 1
 
             # Validate email format
             try:
@@ -617,7 +695,9 @@ class TokenVerificationView(APIView):
                 )
 
             # Fetch verification instance
-            verification = get_object_or_404(ProfileVerification, user__email=email)
+            verification = get_object_or_404(
+                ProfileVerification.objects.select_related("user"), user__email=email
+            )
 
             # Resend token based on force_resend or expiration status
             if force_resend or (verification.is_expired() and not verification.used):
@@ -637,12 +717,6 @@ class TokenVerificationView(APIView):
                 {"error": "User with the given email not found."},
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            logger.error("Unexpected error in token resend: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
 
 
 class UserProfileBulkView(APIView):
@@ -660,34 +734,39 @@ class UserProfileBulkView(APIView):
 
     permission_classes = [IsAuthenticated, IsAdminUser]
 
+    @staticmethod
+    def parse_user_ids(request: Any) -> list[int]:
+        """
+        Parse the comma-separated `user_ids` query parameter into integers.
+
+        Converting here means the `IN` clause binds integer parameters that
+        match the indexed `user_id` column. Empty entries are skipped and
+        duplicates dropped, keeping the first occurrence's order.
+
+        Args:
+            request (Any): The HTTP request carrying the query parameter.
+
+        Returns:
+            list[int]: The requested user IDs, possibly empty.
+
+        Raises:
+            ValueError: If an entry is not an integer.
+        """
+        return list(dict.fromkeys(
+            int(user_id) for user_id in request.query_params.get('user_ids', '').split(',') if user_id
+        ))
+
     @swagger_auto_schema(
         operation_description="Retrieve multiple user profiles.",
-        manual_parameters=[
-            openapi.Parameter(
-                'user_ids',
-                openapi.IN_QUERY,
-                description="Comma-separated list of user IDs",
-                type=openapi.TYPE_STRING,
-                required=True,
-            ),
-        ],
+        manual_parameters=[USER_IDS_PARAMETER],
         responses={
             200: openapi.Response(
                 description="Successfully retrieved profiles.",
                 schema=UserProfileSerializer(many=True)
             ),
-            400: openapi.Response(
-                description="Invalid request parameters.",
-                schema=error_response_schema
-            ),
-            404: openapi.Response(
-                description="One or more profiles not found.",
-                schema=error_response_schema
-            ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            400: INVALID_PARAMETERS_RESPONSE,
+            404: PROFILES_NOT_FOUND_RESPONSE,
+            500: INTERNAL_ERROR_RESPONSE,
         },
     )
     def get(self, request: Any) -> Response:
@@ -704,29 +783,80 @@ class UserProfileBulkView(APIView):
             - 500: Internal server error.
         """
         try:
-            user_ids = request.query_params.get('user_ids', '').split(',')
-            if not user_ids or not all(user_ids):
-                return Response(
-                    {"error": "user_ids parameter is required."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-
-            profiles = UserProfile.objects.filter(user_id__in=user_ids)
-            if not profiles.exists():
-                return Response(
-                    {"error": "No profiles found for the provided user IDs."},
-                    status=status.HTTP_404_NOT_FOUND
-                )
+            user_ids = self.parse_user_ids(request)
+        except ValueError:
+            return Response(
+                {"error": "user_ids must be a comma-separated list of integers."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not user_ids:
+            return Response(
+                {"error": "user_ids parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            serializer = UserProfileSerializer(profiles, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error("Error retrieving user profiles: %s", str(e), exc_info=True)
+        # Read plain rows in one joined query; building model instances
+        # only to serialize them again dominates large bulk reads. Rows are
+        # fetched in chunks and streamed, so memory stays bounded.
+        rows = (
+            UserProfile.objects.filter(user_id__in=user_ids)
+            .values(*BULK_PROFILE_FIELDS)
+            .iterator(chunk_size=BULK_STREAM_CHUNK_SIZE)
+        )
+        first_row = next(rows, None)
+        if first_row is None:
             return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "No profiles found for the provided user IDs."},
+                status=status.HTTP_404_NOT_FOUND
             )
 
+        return StreamingHttpResponse(
+            stream_profile_rows(chain((first_row,), rows)),
+            content_type="application/json",
+            status=status.HTTP_200_OK,
+        )
+
+    @staticmethod
+    def store_upload(profile: UserProfile, validated_data: dict[str, Any]) -> None:
+        """
+        Write an uploaded profile image to storage and keep only its name.
+
+        Runs before any row is locked, so slow storage never holds a lock.
+        `bulk_update` also skips `FileField.pre_save`, which would otherwise
+        store the upload.
+
+        Args:
+            profile (UserProfile): The profile the upload belongs to.
+            validated_data (dict[str, Any]): The serializer's validated data,
+                updated in place.
+        """
+        image = validated_data.get("profile_image")
+        if image:
+            profile.profile_image.save(image.name, image, save=False)
+            validated_data["profile_image"] = profile.profile_image.name
+
+    @staticmethod
+    def apply_update(profile: UserProfile, validated_data: dict[str, Any]) -> None:
+        """
+        Apply validated serializer data to a profile and its user without saving.
+
+        Mirrors `UserProfileSerializer.update` so the caller can persist many
+        profiles with `bulk_update`. Uploads must already be stored with
+        `store_upload`.
+
+        Args:
+            profile (UserProfile): The profile to modify, with its user loaded.
+            validated_data (dict[str, Any]): The serializer's validated data.
+        """
+        validated_data = dict(validated_data)
+        user_data = validated_data.pop("user", {})
+        for field in BULK_USER_UPDATE_FIELDS:
+            if user_data.get(field) is not None:
+                setattr(profile.user, field, user_data[field])
+
+        for field, value in validated_data.items():
+            setattr(profile, field, value)
+
     @swagger_auto_schema(
         operation_description="Update multiple user profiles.",
         request_body=openapi.Schema(
@@ -754,14 +884,8 @@ class UserProfileBulkView(APIView):
                 description="Invalid request data.",
                 schema=error_response_schema
             ),
-            404: openapi.Response(
-                description="One or more profiles not found.",
-                schema=error_response_schema
-            ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            404: PROFILES_NOT_FOUND_RESPONSE,
+            500: INTERNAL_ERROR_RESPONSE,
         },
     )
     def put(self, request: Any) -> Response:
@@ -777,88 +901,174 @@ class UserProfileBulkView(APIView):
             - 404: One or more profiles not found.
             - 500: Internal server error.
         """
-        try:
-            profiles_data = request.data.get('profiles', [])
-            if not profiles_data:
-                return Response(
-                    {"error": "No profile updates provided."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-
-            updated_profiles = []
-            errors = []
-
-            for profile_update in profiles_data:
-                try:
-                    user_id = profile_update.get('user_id')
-                    data = profile_update.get('data', {})
-
-                    if not user_id:
-                        errors.append({"error": "user_id is required.", "data": profile_update})
-                        continue
+        profiles_data = request.data.get('profiles', [])
+        if not profiles_data:
+            return Response(
+                {"error": "No profile updates provided."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not isinstance(profiles_data, list):
+            return Response(
+                {"error": "profiles must be a list."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-                    try:
-                        profile = UserProfile.objects.get(user_id=user_id)
-                    except UserProfile.DoesNotExist:
-                        errors.append({"error": f"Profile not found for user_id {user_id}."})
-                        continue
+        updated_profiles = []
+        errors = []
+        pending = {}
 
-                    serializer = UserProfileSerializer(profile, data=data, partial=True)
-                    if serializer.is_valid():
-                        serializer.save()
-                        updated_profiles.append(serializer.data)
-                    else:
+        for profile_update in profiles_data:
+            if not isinstance(profile_update, dict):
+                errors.append(
+                    {"error": "Each update must be an object.", "data": profile_update}
+                )
+                continue
+            user_id = profile_update.get('user_id')
+            if not user_id:
+                errors.append({"error": "user_id is required.", "data": profile_update})
+                continue
+            try:
+                user_id = int(user_id)
+            except (TypeError, ValueError):
+                errors.append({"user_id": user_id, "error": "user_id must be an integer."})
+                continue
+            data = profile_update.get('data', {})
+            if not isinstance(data, dict):
+                errors.append({"user_id": user_id, "error": "data must be an object."})
+            elif user_id in pending:
+                errors.append(
+                    {"user_id": user_id, "error": "Duplicate user_id in request."}
+                )
+            else:
+                pending[user_id] = data
+
+        # Validate every entry against an unlocked read first, so bad entries
+        # are reported individually and never reach the bulk write.
+        profiles = (
+            UserProfile.objects.select_related('user')
+            .only(*BULK_PROFILE_FIELDS)
+            .in_bulk(pending.keys(), field_name='user_id')
+        )
+        valid = {}
+        for user_id, data in pending.items():
+            profile = profiles.get(user_id)
+            if profile is None:
+                errors.append({"error": f"Profile not found for user_id {user_id}."})
+                continue
+            serializer = UserProfileSerializer(profile, data=data, partial=True)
+            if not serializer.is_valid():
+                errors.append({
+                    "user_id": user_id,
+                    "errors": serializer.errors
+                })
+                continue
+            valid[user_id] = dict(serializer.validated_data)
+
+        # phone_number is unique on CustomUser; one clash inside the batch
+        # UPDATE would fail every entry, so reject clashing entries up front.
+        phone_numbers = {
+            user_id: data["user"]["phone_number"]
+            for user_id, data in valid.items()
+            if data.get("user", {}).get("phone_number") is not None
+        }
+        owners = dict(
+            CustomUser.objects.filter(phone_number__in=set(phone_numbers.values()))
+            .values_list('phone_number', 'id')
+        ) if phone_numbers else {}
+        for user_id, phone_number in phone_numbers.items():
+            if owners.setdefault(phone_number, user_id) != user_id:
+                del valid[user_id]
+                errors.append({
+                    "user_id": user_id,
+                    "errors": {"phone_number": [PHONE_NUMBER_TAKEN_MESSAGE]},
+                })
+
+        for user_id, data in valid.items():
+            self.store_upload(profiles[user_id], data)
+
+        now = timezone.now()
+        changed = {}
+        using = router.db_for_write(UserProfile)
+        try:
+            # Only locking and writing happen inside the transaction. Rows
+            # another request is writing are skipped rather than waited on,
+            # and reported back.
+            with transaction.atomic(using=using):
+                locked = (
+                    UserProfile.objects.using(using)
+                    .select_related('user')
+                    .select_for_update(skip_locked=True)
+                    .only(*BULK_PROFILE_FIELDS)
+                    .in_bulk(valid.keys(), field_name='user_id')
+                ) if valid else {}
+                for user_id, data in valid.items():
+                    profile = locked.get(user_id)
+                    if profile is None:
                         errors.append({
                             "user_id": user_id,
-                            "errors": serializer.errors
+                            "error": "Profile is locked by another update, retry."
                         })
-                except Exception as e:
-                    errors.append({
-                        "user_id": profile_update.get('user_id'),
-                        "error": str(e)
-                    })
-
-            response_data = {
-                "updated_profiles": updated_profiles,
-            }
-            if errors:
-                response_data["errors"] = errors
-
-            return Response(response_data, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error("Error updating user profiles: %s", str(e), exc_info=True)
-            return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        continue
+                    self.apply_update(profile, data)
+                    # bulk_update skips auto_now, so stamp both rows here.
+                    profile.updated_at = profile.user.updated_at = now
+                    changed[user_id] = profile
+
+                if changed:
+                    # A few batched UPDATE statements instead of two per profile.
+                    UserProfile.objects.using(using).bulk_update(
+                        changed.values(),
+                        BULK_PROFILE_UPDATE_FIELDS,
+                        batch_size=BULK_UPDATE_BATCH_SIZE,
+                    )
+                    CustomUser.objects.using(using).bulk_update(
+                        [profile.user for profile in changed.values()],
+                        BULK_USER_UPDATE_FIELDS,
+                        batch_size=BULK_UPDATE_BATCH_SIZE,
+                    )
+        except IntegrityError:
+            # A concurrent write took a phone number after the check above.
+            errors.extend(
+                {"user_id": user_id, "error": "Conflicting concurrent update, retry."}
+                for user_id in changed
+            )
+            changed = {}
+
+        # Drop uploads stored for entries that were not written.
+        for user_id, data in valid.items():
+            if user_id not in changed and data.get("profile_image"):
+                profiles[user_id].profile_image.storage.delete(data["profile_image"])
+
+        if changed:
+            # bulk_update sends no post_save, so drop cached users and profiles here.
+            cache.delete_many(
+                [auth_user_cache_key(user_id) for user_id in changed]
+                + [UserProfile.cache_key(user_id) for user_id in changed]
             )
+            updated_profiles = [
+                UserProfileSerializer(profile).data for profile in changed.values()
+            ]
+
+        response_data = {
+            "updated_profiles": updated_profiles,
+        }
+        if errors:
+            response_data["errors"] = errors
+
+        # The payload is already plain JSON-ready data, so skip DRF's content
+        # negotiation and renderer for this admin-only bulk response.
+        return JsonResponse(response_data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         operation_description="Delete multiple user profiles.",
-        manual_parameters=[
-            openapi.Parameter(
-                'user_ids',
-                openapi.IN_QUERY,
-                description="Comma-separated list of user IDs",
-                type=openapi.TYPE_STRING,
-                required=True,
-            ),
-        ],
+        manual_parameters=[USER_IDS_PARAMETER],
         responses={
             204: openapi.Response(
                 description="Successfully deleted profiles.",
             ),
-            400: openapi.Response(
-                description="Invalid request parameters.",
-                schema=error_response_schema
-            ),
-            404: openapi.Response(
-                description="One or more profiles not found.",
-                schema=error_response_schema
-            ),
-            500: openapi.Response(
-                description="Internal server error.",
-                schema=error_response_schema
-            ),
+            400: INVALID_PARAMETERS_RESPONSE,
+            404: PROFILES_NOT_FOUND_RESPONSE,
+            500: INTERNAL_ERROR_RESPONSE,
         },
     )
     def delete(self, request: Any) -> Response:
@@ -875,29 +1085,28 @@ class UserProfileBulkView(APIView):
             - 500: Internal server error.
         """
         try:
-            user_ids = request.query_params.get('user_ids', '').split(',')
-            if not user_ids or not all(user_ids):
-                return Response(
-                    {"error": "user_ids parameter is required."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-
-            profiles = UserProfile.objects.filter(user_id__in=user_ids)
-            if not profiles.exists():
-                return Response(
-                    {"error": "No profiles found for the provided user IDs."},
-                    status=status.HTTP_404_NOT_FOUND
-                )
+            user_ids = self.parse_user_ids(request)
+        except ValueError:
+            return Response(
+                {"error": "user_ids must be a comma-separated list of integers."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not user_ids:
+            return Response(
+                {"error": "user_ids parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            profiles.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        except Exception as e:
-            logger.error("Error deleting user profiles: %s", str(e), exc_info=True)
+        # The delete's row count doubles as the existence check.
+        deleted, _ = UserProfile.objects.filter(user_id__in=user_ids).delete()
+        if not deleted:
             return Response(
-                {"error": "An unexpected error occurred.", "details": str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "No profiles found for the provided user IDs."},
+                status=status.HTTP_404_NOT_FOUND
             )
 
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
 
 
 
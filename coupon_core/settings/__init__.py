@@ -3,8 +3,14 @@ from dotenv import load_dotenv
 import sentry_sdk
 from sentry_sdk.integrations.django import DjangoIntegration
 
+# Settings modules that configure their own test environment
+TEST_SETTINGS_MODULES = {
+    "coupon_core.settings.test",
+    "coupon_core.settings.test_sqlite",
+}
+
 # Only load environment variables if not in test mode
-if os.getenv("DJANGO_SETTINGS_MODULE") != "coupon_core.settings.test":
+if os.getenv("DJANGO_SETTINGS_MODULE") not in TEST_SETTINGS_MODULES:
     load_dotenv()
     # Determine environment
     ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
@@ -17,13 +23,20 @@ if os.getenv("DJANGO_SETTINGS_MODULE") != "coupon_core.settings.test":
     else:
         from .dev import *
     
-    # Configure Sentry (applies to all environments except test)
+    # Configure Sentry (applies to all environments except test). Skip the
+    # init if a client is already active, e.g. when settings are re-imported.
     SENTRY_DSN = os.getenv("SENTRY_DSN", "")
-    if SENTRY_DSN:
+    if SENTRY_DSN and not sentry_sdk.get_client().is_active():
         sentry_sdk.init(
             dsn=SENTRY_DSN,
             integrations=[DjangoIntegration()],
-            traces_sample_rate=1.0 if ENVIRONMENT == "production" else 0.5,  # Adjust sampling
+            # Trace a small share of requests; every traced request builds and
+            # ships a span per DB query. Override via SENTRY_TRACES_SAMPLE_RATE.
+            traces_sample_rate=float(
+                os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.05" if ENVIRONMENT == "production" else "0.0")
+            ),
+            profiles_sample_rate=float(os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0.0")),
+            max_breadcrumbs=20,  # Cap per-request breadcrumb memory
             send_default_pii=True,  # Capture user context in production
             environment=ENVIRONMENT,  # Assign correct environment in Sentry logs
         )
@@ -114,12 +114,13 @@ USE_TZ = True
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authentication.v1.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.TokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "EXCEPTION_HANDLER": "authentication.v1.exceptions.handler",
 }
 
 AUTH_SERVICE_URL = os.getenv("AUTH_SERVICE_URL")
@@ -150,6 +151,8 @@ SWAGGER_SETTINGS = {
              'in': 'header'
          }
     },
+    # The API authenticates with bearer tokens only; drop the session login UI.
+    'USE_SESSION_AUTH': False,
 }
 
 # Social authentication settings
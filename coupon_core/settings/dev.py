@@ -15,6 +15,7 @@ import os
 import logging
 from datetime import timedelta
 from pathlib import Path
+from django.conf import global_settings
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -81,8 +82,16 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", "password"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        # Reuse connections across requests instead of reconnecting each time;
+        # the same settings apply to every alias below.
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
-            "sslmode": "disable"
+            "sslmode": "disable",
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
         }
      
         
@@ -94,8 +103,14 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", "password"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
-            "sslmode": "disable"
+            "sslmode": "disable",
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
         }
      
     },
@@ -106,8 +121,14 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", "password"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
-            "sslmode": "disable"
+            "sslmode": "disable",
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
         }
     },
     "vector_db": {
@@ -117,8 +138,14 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", "password"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", "5432"),
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
-            "sslmode": "disable"
+            "sslmode": "disable",
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
         }
     
     },
@@ -130,15 +157,32 @@ REDIS_HOST = os.getenv("DEV_REDIS_HOST", "localhost")
 REDIS_PASSWORD = os.getenv("DEV_REDIS_PASS", "redis_password")
 REDIS_PORT = 6379
 
+# Connection URLs, one per Redis consumer, so the logical database each one
+# uses is visible in a single place.
+REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}"
+CACHE_REDIS_URL = f"{REDIS_URL}/0"
+RESULTS_REDIS_URL = f"{REDIS_URL}/0"
+CHANNELS_REDIS_URL = f"{REDIS_URL}/0"
+CELERY_REDIS_URL = f"{REDIS_URL}/0"
+
+# Connection pool settings shared by the Redis caches. redis-py picks the
+# hiredis parser automatically when it is installed.
+REDIS_CACHE_OPTIONS = {
+    "max_connections": 50,
+    "socket_keepalive": True,
+}
+
 # Caching (Redis)
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0",
+        "LOCATION": CACHE_REDIS_URL,
+        "OPTIONS": REDIS_CACHE_OPTIONS,
     },
     "results": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0",
+        "LOCATION": RESULTS_REDIS_URL,
+        "OPTIONS": REDIS_CACHE_OPTIONS,
     },
 }
 
@@ -146,7 +190,7 @@ CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
         "CONFIG": {
-            "hosts": [f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0"],
+            "hosts": [CHANNELS_REDIS_URL],
         },
     },
 }
@@ -155,8 +199,8 @@ CHANNEL_LAYERS = {
 # Celery Configuration (RabbitMQ)
 # -----------------------------------------------
 
-CELERY_BROKER_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0"
-CELERY_RESULT_BACKEND = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:6379/0"
+CELERY_BROKER_URL = CELERY_REDIS_URL
+CELERY_RESULT_BACKEND = CELERY_REDIS_URL
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
 
@@ -169,6 +213,18 @@ CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 # -----------------------------------------------
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 
+# -----------------------------------------------
+# Password Hashing
+# -----------------------------------------------
+# FAST_PASSWORDS=1 hashes new and re-saved passwords with MD5 so logins in
+# local and E2E runs skip PBKDF2 key stretching. The default hashers stay
+# listed, so existing password hashes still verify.
+if os.getenv("FAST_PASSWORDS", "").lower() in ("1", "true", "yes"):
+    PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+        *global_settings.PASSWORD_HASHERS,
+    ]
+
 # -----------------------------------------------
 # SimpleJWT Authentication Configuration
 # -----------------------------------------------
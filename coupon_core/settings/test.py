@@ -28,14 +28,17 @@ class TestRouter:
         return True
 
 # Unset environment variables that might interfere with test settings
-os.environ.pop('DB_PORT', None)
-os.environ.pop('DB_HOST', None)
-os.environ.pop('DB_USER', None)
-os.environ.pop('DB_PASSWORD', None)
-os.environ.pop('POSTGRES_USER', None)
-os.environ.pop('POSTGRES_PASSWORD', None)
-os.environ.pop('POSTGRES_DB', None)
-os.environ.pop('DATABASE_URL', None)
+for env_var in (
+    'DB_PORT',
+    'DB_HOST',
+    'DB_USER',
+    'DB_PASSWORD',
+    'POSTGRES_USER',
+    'POSTGRES_PASSWORD',
+    'POSTGRES_DB',
+    'DATABASE_URL',
+):
+    os.environ.pop(env_var, None)
 
 # Debug
 DEBUG = False
@@ -104,7 +107,7 @@ MIDDLEWARE = [m for m in MIDDLEWARE if 'csrf' not in m.lower()]
 DATABASE_ROUTERS = ['coupon_core.settings.test.TestRouter']
 
 # Test-specific settings
-TEST_RUNNER = 'django.test.runner.DiscoverRunner'
+TEST_RUNNER = 'coupon_core.utils.runners.ParallelDiscoverRunner'
 TEST_OUTPUT_DIR = os.path.join(BASE_DIR, 'test_reports')
 
 # Create test reports directory if it doesn't exist
@@ -133,13 +136,14 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'unique-snowflake',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
     }
 }
 
 # Disable throttling during tests
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.v1.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.TokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -147,6 +151,7 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_THROTTLE_CLASSES': [],
     'DEFAULT_THROTTLE_RATES': {},
+    'EXCEPTION_HANDLER': 'authentication.v1.exceptions.handler',
 }
 
 # SimpleJWT Configuration
@@ -168,16 +173,3 @@ STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
 
 # Allow all hosts during tests
 ALLOWED_HOSTS = ['*']
-
-# Test-specific settings
-TEST_RUNNER = 'django.test.runner.DiscoverRunner'
-TEST_OUTPUT_DIR = os.path.join(BASE_DIR, 'test_reports')
-
-# Create test reports directory if it doesn't exist
-os.makedirs(TEST_OUTPUT_DIR, exist_ok=True)
-
-# Required for spatialite
-SPATIALITE_LIBRARY_PATH = 'mod_spatialite'
-
-# CORS Configuration
-CORS_ALLOW_ALL_ORIGINS = True 
\ No newline at end of file
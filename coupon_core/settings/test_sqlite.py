@@ -0,0 +1,24 @@
+"""
+In-memory SQLite test settings for the coupon_core project.
+
+This module extends the regular test settings and swaps every database alias
+for an in-memory SpatiaLite database. The authentication tests only rely on
+ORM features that SpatiaLite supports, so they can run without a PostGIS
+server and without paying network round-trips on every INSERT/SELECT.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=coupon_core.settings.test_sqlite \
+        python manage.py test authentication --keepdb
+"""
+
+from .test import *  # Import test settings first
+
+# Every alias points at its own in-memory SpatiaLite database. Django creates
+# the test databases in memory as well, so `--keepdb` is effectively free.
+DATABASES = {
+    alias: {
+        'ENGINE': 'django.contrib.gis.db.backends.spatialite',
+        'NAME': ':memory:',
+    }
+    for alias in ('default', 'authentication_shard', 'geodiscounts_db', 'vector_db')
+}
@@ -64,9 +64,13 @@ for app_name, app_url in app_urls.items():
             path(f"api/{app_name}/", include(app_url)),  # Keep original prefix for other apps
         ]
 
+# Seconds the rendered docs and schema are cached. The schema only changes on
+# deploy, so outside DEBUG it is not regenerated for every request.
+SCHEMA_CACHE_TIMEOUT = 0 if settings.DEBUG else 60 * 60
+
 # Add Swagger and Redoc endpoints (typically for development)
 urlpatterns += [
-    path('', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-swagger-ui'),
+    path('redoc/', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-redoc'),
 ]
 
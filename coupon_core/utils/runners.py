@@ -0,0 +1,30 @@
+"""
+Custom Django test runners.
+
+This module provides a DiscoverRunner that runs test classes in parallel
+worker processes by default.
+"""
+
+from typing import Any
+
+from django.test.runner import DiscoverRunner, get_max_test_processes
+
+
+class ParallelDiscoverRunner(DiscoverRunner):
+    """
+    DiscoverRunner that defaults to one worker process per CPU.
+
+    Each worker gets its own clone of the test databases and its own copy of
+    the signal registry, so test classes are fully isolated from each other.
+    An explicit `--parallel N` on the command line still takes precedence.
+    """
+
+    def __init__(self, parallel: int = 0, **kwargs: Any) -> None:
+        """
+        Initialize the runner, falling back to all available CPUs.
+
+        Args:
+            parallel (int): Number of worker processes requested on the command line.
+            **kwargs: Remaining DiscoverRunner options.
+        """
+        super().__init__(parallel=parallel or get_max_test_processes(), **kwargs)
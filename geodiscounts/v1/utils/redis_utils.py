@@ -6,9 +6,7 @@ Extends RedisClient functionality for discount-specific use cases.
 
 import json
 
-from authentication.v1.utils.redis_client import RedisClient
-
-redis_client = RedisClient()
+from authentication.v1.utils import redis_client
 
 
 def cache_discount_query(key: str, results: list, expiry: int = 300) -> None: